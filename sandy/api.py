@@ -3,11 +3,11 @@ import mimetypes
 import os
 import shutil
 import subprocess
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from threading import Thread
+from threading import Lock, Thread
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
@@ -242,6 +242,22 @@ class ApiService:
     pipeline: Any
     runtime_state: Any
     test_mode: bool
+    # Built on first use and kept: a Registry opens two SQLite connections
+    # and runs its schema setup, too much to repeat per trace request.
+    _registry: Registry | None = field(default=None, init=False, repr=False)
+    _registry_lock: Lock = field(default_factory=Lock, init=False, repr=False)
+
+    def _get_registry(self) -> Registry | None:
+        with self._registry_lock:
+            if self._registry is None:
+                self._registry = _build_registry(test_mode=self.test_mode)
+            return self._registry
+
+    def close(self) -> None:
+        with self._registry_lock:
+            if self._registry is not None:
+                self._registry.close()
+                self._registry = None
 
     def status_payload(self) -> dict[str, Any]:
         runtime = self.runtime_state.snapshot()
@@ -274,8 +290,7 @@ class ApiService:
         detail = logs.get_trace_detail(test_mode=self.test_mode, trace_id=trace_id)
         if detail is None:
             return None
-        registry = _build_registry(test_mode=self.test_mode)
-        return _enrich_trace_detail(detail, registry=registry)
+        return _enrich_trace_detail(detail, registry=self._get_registry())
 
 
 class _ApiHandler(BaseHTTPRequestHandler):
@@ -377,4 +392,5 @@ class ApiServer:
     def shutdown(self) -> None:
         self._server.shutdown()
         self._server.server_close()
+        self._server.api_service.close()  # type: ignore[attr-defined]
         self._thread.join(timeout=2)
@@ -33,6 +33,10 @@ class LlmConfig:
     summarizer_model: str = "hf.co/bartowski/Llama-3.2-3B-Instruct-GGUF:Q8_0"
     vision_model: str | None = None
     vision_router_model: str | None = None
+    # Optional cheap first-pass bouncer.  Its decision is kept when it reports
+    # confidence >= bouncer_escalate_below; otherwise bouncer_model decides.
+    bouncer_small_model: str | None = None
+    bouncer_escalate_below: float = 0.8
 
     brain_temperature: float = 1.1
     bouncer_temperature: float = 0.1
@@ -54,6 +58,33 @@ class LlmConfig:
     prewarm_num_ctx: int | None = None  # defaults to bouncer_num_ctx
 
     keep_alive: str = "1h"
+    # HTTP timeout for each ollama request (per chunk when streaming).
+    # Generous enough for a cold model load; 0 disables it.
+    request_timeout_seconds: float = 300.0
+    # keep_alive for the small background models (tagger / summarizer).
+    # They reload cheaply and off the reply path, so they can give their
+    # VRAM back sooner than the brain/bouncer models.
+    background_keep_alive: str = "5m"
+
+    # How long background roles (tagger / summarizer) wait for the shared
+    # LLM lock before giving up and storing the message without them.
+    # <= 0 waits indefinitely (they still yield to brain/bouncer calls).
+    background_wait_seconds: float = 60.0
+
+    # Concurrent ollama requests Sandy allows.  1 keeps one inference on the
+    # GPU at a time; raise it only if ollama runs with OLLAMA_NUM_PARALLEL
+    # (and enough VRAM) to serve that many.
+    parallel_slots: int = 1
+
+    # ask_tagger() calls landing within this window are tagged together in
+    # one inference, up to tagger_batch_max messages (1 disables batching).
+    tagger_batch_window_seconds: float = 0.05
+    tagger_batch_max: int = 8
+
+    # Seconds between keep-alive pings to the brain/bouncer models, so they
+    # stay resident even if keep_alive lapses or the driver evicts them.
+    # 0 disables the heartbeat.
+    heartbeat_seconds: float = 0.0
 
     @property
     def effective_prewarm_num_ctx(self) -> int:
@@ -209,6 +240,8 @@ class SandyConfig:
                 summarizer_model=_str("SUMMARIZER_MODEL", _llm.summarizer_model),
                 vision_model=_opt_str("VISION_MODEL"),
                 vision_router_model=_opt_str("VISION_ROUTER_MODEL"),
+                bouncer_small_model=_opt_str("BOUNCER_SMALL_MODEL"),
+                bouncer_escalate_below=_float("BOUNCER_ESCALATE_BELOW", _llm.bouncer_escalate_below),
                 brain_temperature=_float("BRAIN_TEMPERATURE", _llm.brain_temperature),
                 bouncer_temperature=_float("BOUNCER_TEMPERATURE", _llm.bouncer_temperature),
                 tagger_temperature=_float("TAGGER_TEMPERATURE", _llm.tagger_temperature),
@@ -227,6 +260,13 @@ class SandyConfig:
                 vision_router_num_predict=_int("VISION_ROUTER_NUM_PREDICT", _llm.vision_router_num_predict),
                 prewarm_num_ctx=_int("PREWARM_NUM_CTX", bouncer_num_ctx),
                 keep_alive=_str("OLLAMA_KEEP_ALIVE", _llm.keep_alive),
+                request_timeout_seconds=_float("OLLAMA_TIMEOUT_SECONDS", _llm.request_timeout_seconds),
+                background_keep_alive=_str("OLLAMA_BACKGROUND_KEEP_ALIVE", _llm.background_keep_alive),
+                background_wait_seconds=_float("LLM_BACKGROUND_WAIT_SECONDS", _llm.background_wait_seconds),
+                parallel_slots=_int("LLM_PARALLEL_SLOTS", _llm.parallel_slots),
+                tagger_batch_window_seconds=_float("TAGGER_BATCH_WINDOW_SECONDS", _llm.tagger_batch_window_seconds),
+                tagger_batch_max=_int("TAGGER_BATCH_MAX", _llm.tagger_batch_max),
+                heartbeat_seconds=_float("OLLAMA_HEARTBEAT_SECONDS", _llm.heartbeat_seconds),
             ),
             voice=VoiceConfig(
                 stt_model=_str("VOICE_STT_MODEL", _voice.stt_model),
@@ -20,6 +20,7 @@ Usage:
 from collections import deque
 from dataclasses import dataclass, field as _dc_field
 from datetime import datetime, timezone
+from typing import NamedTuple
 
 import discord
 
@@ -68,6 +69,60 @@ class SyntheticMessage:
     mentions: list = _dc_field(default_factory=list)
 
 
+# ---------------------------------------------------------------------------
+# Cached snapshots — what Last10 actually keeps in its deques
+# ---------------------------------------------------------------------------
+
+class _CachedMember(NamedTuple):
+    id: int
+    display_name: str
+
+
+class _CachedAuthor(NamedTuple):
+    id: int
+    display_name: str
+    bot: bool = False
+
+
+class _CachedPlace(NamedTuple):
+    """Guild or channel: just the id and name the formatters read."""
+    id: int
+    name: str
+
+
+class _CachedMessage(NamedTuple):
+    """Immutable tuple snapshot of the message fields Last10 formats.
+
+    Holding a full discord.Message in the deque keeps its whole object graph
+    (member, guild, state, attachments, embeds) alive for as long as the
+    message stays in the window.  Snapshotting at add() time keeps the cache
+    small and duck-type compatible with the discord.Message attributes read
+    by ChannelHistory.
+    """
+    content: str
+    created_at: datetime
+    author: _CachedAuthor
+    guild: _CachedPlace
+    channel: _CachedPlace
+    mentions: tuple[_CachedMember, ...] = ()
+
+
+def _snapshot(message) -> _CachedMessage:
+    """Copy the fields ChannelHistory needs out of a (possibly synthetic) message."""
+    author = message.author
+    return _CachedMessage(
+        content=message.content or "",
+        created_at=message.created_at,
+        author=_CachedAuthor(author.id, author.display_name, bool(getattr(author, "bot", False))),
+        guild=_CachedPlace(message.guild.id, message.guild.name),
+        channel=_CachedPlace(message.channel.id, message.channel.name),
+        mentions=tuple(
+            _CachedMember(member.id, member.display_name)
+            for member in getattr(message, "mentions", None) or ()
+        ),
+    )
+
+
 def resolve_mentions(content: str, mentions: list[discord.Member]) -> str:
     """Replace Discord mention tokens with human-readable display names.
 
@@ -266,7 +321,7 @@ class Last10:
     def __init__(self, maxlen: int = 10, registry=None):
         self.maxlen = maxlen
         self.registry = registry
-        self._cache: dict[tuple[int, int], deque[discord.Message]] = {}
+        self._cache: dict[tuple[int, int], deque[_CachedMessage]] = {}
 
     # ------------------------------------------------------------------
     # Writing
@@ -276,12 +331,13 @@ class Last10:
         """Append a message to its channel's rolling cache.
 
         The oldest message is automatically evicted once the deque is full.
-        Safe to call for every message in on_message.
+        Safe to call for every message in on_message.  Only a small tuple
+        snapshot of the message is kept, not the message object itself.
         """
         key = (message.guild.id, message.channel.id)
         if key not in self._cache:
             self._cache[key] = deque(maxlen=self.maxlen)
-        self._cache[key].append(message)
+        self._cache[key].append(_snapshot(message))
 
     # ------------------------------------------------------------------
     # Reading
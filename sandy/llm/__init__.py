@@ -6,6 +6,8 @@ Wraps the four LLM roles Sandy uses:
     Brain      — main personality model; responds to users in Discord
     Bouncer    — decision engine; decides if Sandy should respond and
                  recommends tool calls when additional context would help
+                 (optionally via a small first-pass model that escalates to
+                 the full bouncer when it isn't confident)
     Tagger     — small model; generates 1-3 recall tags for a message
     Summarizer — small model; optionally summarises long messages before recall
 
@@ -21,31 +23,80 @@ into the brain's context before asking it to respond.
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Callable
 
+import httpx
 import ollama
 
-from ..prompt import SandyPrompt
+from ..prompt import OllamaPrompt, SandyPrompt
 from ..logconf import emit_forensic_record, get_logger
 from ..trace import TurnTrace, forensic_payload
 from .models import (
+    BOUNCER_SCHEMA,
+    SMALL_BOUNCER_SCHEMA,
+    SUMMARIZER_SCHEMA,
+    TAGGER_BATCH_SCHEMA,
+    TAGGER_SCHEMA,
     BouncerResponse,
     BrainResponse,
+    SmallBouncerResponse,
     SummarizerResponse,
+    TaggerBatchResponse,
     TaggerResponse,
 )
 from .coercion import (
     _coerce_bouncer_tool_selection,
     _extract_history_messages,
     _infer_steam_browse_category,
+    _is_trivial_latest_message,
     _looks_like_direct_image_ask,
 )
+from .scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_BRAIN,
+    PRIORITY_INTERACTIVE,
+    PriorityLock,
+)
 
 if TYPE_CHECKING:
     from ..config import LlmConfig
 
 logger = get_logger(__name__)
 
+# Connection pool for the shared ollama AsyncClient.  Background memory work
+# and the turn pipeline can have several requests queued behind the LLM lock
+# at once; keeping idle connections around avoids a fresh TCP handshake for
+# each of them.  (ollama serves plain HTTP/1.1, so HTTP/2 is not an option.)
+# Coalesced tagger batches are sized against tagger_num_ctx, or ollama would
+# silently cut the front of the prompt (the system prompt and the first
+# messages).  Characters per token is a conservative guess for chat text;
+# the reserve covers the JSON reply; the per-message overhead covers the
+# "Message N:" framing.
+_TAGGER_CHARS_PER_TOKEN = 3
+_TAGGER_REPLY_RESERVE_TOKENS = 512
+_TAGGER_MESSAGE_OVERHEAD_CHARS = 16
+
+_OLLAMA_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=50,
+    keepalive_expiry=60,
+)
+
+
+# How long a successful is_running() check is trusted before re-probing.
+_HEALTH_TTL_SECONDS = 30.0
+
+# Rough chars-per-token ratio used to size num_keep without a tokenizer.
+# Deliberately on the high side so the estimate undershoots: keeping a few
+# tokens too few is harmless, keeping too many would pin dynamic text.
+_CHARS_PER_TOKEN = 4
+
+
+def _estimate_prefix_tokens(text: str) -> int:
+    """Conservative token estimate for a static prompt prefix."""
+    return len(text) // _CHARS_PER_TOKEN
+
 
 # ---------------------------------------------------------------------------
 # Fallback config built from env vars — used ONLY when no LlmConfig is passed
@@ -79,12 +130,68 @@ class OllamaInterface:
     def __init__(self, config: "LlmConfig | None" = None) -> None:
         from ..config import LlmConfig
         self._cfg: LlmConfig = config if config is not None else _default_llm_config()
-        self._client = ollama.AsyncClient()
-        self._lock = asyncio.Lock()
+        # ollama's client has no timeout by default; a hung request would
+        # then hold the LLM lock forever.  Streams apply it per chunk read.
+        timeout = self._cfg.request_timeout_seconds
+        self._client = ollama.AsyncClient(
+            limits=_OLLAMA_HTTP_LIMITS,
+            timeout=httpx.Timeout(timeout) if timeout > 0 else None,
+        )
+        self._lock = PriorityLock(slots=self._cfg.parallel_slots)
+        self._healthy_at: float | None = None
+        # ask_tagger() coalescing state; see _flush_tagger_pending().
+        self._tagger_pending: list[tuple[str, asyncio.Future[list[str]]]] = []
+        self._tagger_pending_chars = 0
+        self._tagger_batch_budget = (
+            (self._cfg.tagger_num_ctx - _TAGGER_REPLY_RESERVE_TOKENS) * _TAGGER_CHARS_PER_TOKEN
+            - len(SandyPrompt.tagger_prompt("").system)
+        )
+        self._tagger_flush_timer: asyncio.TimerHandle | None = None
+        self._tagger_tasks: set[asyncio.Task[None]] = set()
+
+    async def _acquire_background(self, role: str) -> bool:
+        """Take the shared lock for a skippable background role.
+
+        Returns False (without holding the lock) if it could not be acquired
+        within ``background_wait_seconds``; the caller should skip its call.
+        A value <= 0 means no deadline: the PriorityLock already serves brain
+        and bouncer calls first, so background work just queues behind them
+        and is never dropped.
+        """
+        wait = self._cfg.background_wait_seconds
+        try:
+            await asyncio.wait_for(
+                self._lock.acquire(PRIORITY_BACKGROUND),
+                timeout=wait if wait > 0 else None,
+            )
+        except TimeoutError:
+            logger.warning(
+                "%s skipped: LLM was busy for more than %.0fs",
+                role,
+                self._cfg.background_wait_seconds,
+            )
+            return False
+        return True
+
+    def _background_keep_alive(self, model_name: str) -> str:
+        """keep_alive for a tagger/summarizer call to *model_name*.
+
+        ollama tracks keep_alive per model and the latest request wins, so a
+        background model that doubles as the brain or bouncer keeps the
+        primary value rather than shortening the main model's residency.
+        """
+        if model_name in (self._cfg.brain_model, self._cfg.bouncer_model):
+            return self._cfg.keep_alive
+        return self._cfg.background_keep_alive
+
+    @property
+    def tagger_batch_max(self) -> int:
+        """Most messages one coalesced Tagger call will cover."""
+        return max(1, self._cfg.tagger_batch_max)
 
     def is_busy(self) -> bool:
-        """Return whether an Ollama request currently holds the shared lock."""
-        return self._lock.locked()
+        """Return whether any Ollama request currently holds the shared lock."""
+        return self._lock.in_use > 0
 
     def non_voice_model_names(self) -> list[str]:
         """Return configured Ollama models that voice mode does not need."""
@@ -107,13 +214,23 @@ class OllamaInterface:
     # ------------------------------------------------------------------
 
     async def is_running(self) -> bool:
-        """Return True if the ollama service is reachable."""
-        try:
-            await self._client.list()
+        """Return True if the ollama service is reachable.
+
+        Uses ``ps()`` (loaded runners only) rather than ``list()``, which makes
+        ollama enumerate every installed model.  A success is remembered for
+        ``_HEALTH_TTL_SECONDS`` so back-to-back checks don't hit the server.
+        """
+        now = time.monotonic()
+        if self._healthy_at is not None and now - self._healthy_at < _HEALTH_TTL_SECONDS:
             return True
+        try:
+            await self._client.ps()
         except Exception as exc:
+            self._healthy_at = None
             logger.warning("ollama health check failed: %s", exc)
             return False
+        self._healthy_at = now
+        return True
 
     async def loaded_model_names(self) -> list[str]:
         """Return currently loaded Ollama runner model names."""
@@ -132,7 +249,7 @@ class OllamaInterface:
     async def unload_model(self, model_name: str) -> bool:
         """Ask Ollama to unload one model runner."""
         try:
-            async with self._lock:
+            async with self._lock.hold(PRIORITY_INTERACTIVE):
                 await self._client.generate(
                     model=model_name,
                     prompt="",
@@ -152,19 +269,76 @@ class OllamaInterface:
     # Warmer
     # -----------------------------------------------------------------
 
-    async def warm_model(self, model_name: str) -> bool:
-        """Send a minimal generate request so ollama loads the model."""
-        try:
-            async with self._lock:
+    @property
+    def heartbeat_seconds(self) -> float:
+        """Interval for heartbeat(); 0 means the heartbeat is disabled."""
+        return self._cfg.heartbeat_seconds
+
+    async def heartbeat(self) -> int:
+        """Refresh keep_alive on the brain and bouncer models.
+
+        Each ping is an empty generate with the role's own num_ctx (a
+        different num_ctx would make ollama reload the runner).  Pings run at
+        background priority and are skipped if the LLM stays busy, so they
+        never hold up a reply.  Returns how many models were pinged.
+        """
+        targets: dict[str, int] = {self._cfg.brain_model: self._cfg.brain_num_ctx}
+        targets.setdefault(self._cfg.bouncer_model, self._cfg.bouncer_num_ctx)
+        pinged = 0
+        for model_name, num_ctx in targets.items():
+            if not await self._acquire_background("Heartbeat"):
+                break
+            try:
                 await self._client.generate(
                     model=model_name,
                     prompt="",
                     keep_alive=self._cfg.keep_alive,
-                    options={
-                        "num_ctx": self._cfg.effective_prewarm_num_ctx,
-                        "num_predict": 0,
-                    },
+                    options={"num_ctx": num_ctx, "num_predict": 0},
                 )
+            except Exception as exc:
+                logger.warning("Heartbeat for %s failed: %s", model_name, exc)
+            else:
+                pinged += 1
+            finally:
+                self._lock.release()
+        return pinged
+
+    async def warm_model(self, model_name: str) -> bool:
+        """Send a minimal request so ollama loads the model.
+
+        Warming the brain model (at its own num_ctx) sends the persona system
+        prompt instead of an empty prompt: that prefills the prefix every
+        reply starts with, and ollama reports what it costs in tokens.
+        """
+        options = {
+            "num_ctx": self._cfg.effective_prewarm_num_ctx,
+            "num_predict": 0,
+        }
+        try:
+            async with self._lock.hold(PRIORITY_INTERACTIVE):
+                if (
+                    model_name == self._cfg.brain_model
+                    and options["num_ctx"] == self._cfg.brain_num_ctx
+                ):
+                    persona = SandyPrompt.brain_prompt().system
+                    response = await self._client.chat(
+                        model=model_name,
+                        messages=[{"role": "system", "content": persona}],
+                        keep_alive=self._cfg.keep_alive,
+                        options={**options, "num_predict": 1},
+                    )
+                    logger.info(
+                        "Brain persona prompt: %s tokens (%d chars), prefilled during warm-up",
+                        getattr(response, "prompt_eval_count", None),
+                        len(persona),
+                    )
+                else:
+                    await self._client.generate(
+                        model=model_name,
+                        prompt="",
+                        keep_alive=self._cfg.keep_alive,
+                        options=options,
+                    )
             return True
         except Exception as e:
             logger.error("Error occured when warming %s: %s", model_name, e)
@@ -185,7 +359,7 @@ class OllamaInterface:
         temperature: float | None = None,
     ) -> str | None:
         try:
-            async with self._lock:
+            async with self._lock.hold(PRIORITY_INTERACTIVE):
                 options = {
                     "num_ctx": num_ctx,
                     "num_predict": num_predict,
@@ -246,24 +420,42 @@ class OllamaInterface:
         trace: TurnTrace | None = None,
     ) -> BouncerResponse:
         """Decide whether Sandy should respond, and optionally which tool to use."""
+        if _is_trivial_latest_message(context):
+            logger.debug("Bouncer fast path: trivial latest message, skipping LLM call")
+            return BouncerResponse.model_construct(
+                should_respond=False,
+                reason="Deterministic fast path: latest message is a bare acknowledgement or emoji.",
+                use_tool=False,
+            )
         prompt = SandyPrompt.bouncer_prompt(context)
         try:
-            async with self._lock:
-                response = await self._client.chat(
-                    model=self._cfg.bouncer_model,
-                    messages=[
-                        {"role": "system", "content": prompt.system},
-                        {"role": "user",   "content": prompt.user},
-                    ],
-                    format=BouncerResponse.model_json_schema(),
-                    keep_alive=self._cfg.keep_alive,
-                    options={
-                        "temperature": self._cfg.bouncer_temperature,
-                        "num_ctx": self._cfg.bouncer_num_ctx,
-                    },
+            model = self._cfg.bouncer_model
+            result: BouncerResponse | None = None
+            small_model = self._cfg.bouncer_small_model
+            if small_model and small_model != model:
+                # Only the small model is asked for a confidence score.
+                small_prompt = SandyPrompt.bouncer_prompt(
+                    context, confidence_below=self._cfg.bouncer_escalate_below,
                 )
-            raw_response = response.message.content or ""
-            result = BouncerResponse.model_validate_json(raw_response)
+                try:
+                    small_result, small_raw, small_options = await self._bouncer_decision(
+                        small_model, small_prompt, small=True,
+                    )
+                except Exception as exc:
+                    logger.warning("Small bouncer %s failed, escalating: %s", small_model, exc)
+                else:
+                    if (small_result.confidence or 0.0) >= self._cfg.bouncer_escalate_below:
+                        model, result, prompt = small_model, small_result, small_prompt
+                        raw_response, options = small_raw, small_options
+                    else:
+                        logger.debug(
+                            "Small bouncer confidence %s below %.2f — escalating to %s",
+                            small_result.confidence,
+                            self._cfg.bouncer_escalate_below,
+                            model,
+                        )
+            if result is None:
+                result, raw_response, options = await self._bouncer_decision(model, prompt)
             result = _coerce_bouncer_tool_selection(context, result)
             if not result.should_respond:
                 result.use_tool = False
@@ -283,13 +475,10 @@ class OllamaInterface:
                     forensic_payload(
                         trace,
                         "bouncer_decision",
-                        model=self._cfg.bouncer_model,
+                        model=model,
                         prompt_system=prompt.system,
                         prompt_user=prompt.user,
-                        options={
-                            "temperature": self._cfg.bouncer_temperature,
-                            "num_ctx": self._cfg.bouncer_num_ctx,
-                        },
+                        options=options,
                         parsed_result=result.model_dump(),
                         raw_response=raw_response,
                     ),
@@ -297,34 +486,139 @@ class OllamaInterface:
             return result
         except Exception as exc:
             logger.error("Bouncer error (defaulting to no-respond): %s", exc)
-            return BouncerResponse(
+            # Known-good field values — no need to run the validators again.
+            return BouncerResponse.model_construct(
                 should_respond=False,
                 reason=f"error: {exc}",
                 use_tool=False,
             )
 
+    async def _bouncer_decision(
+        self,
+        model_name: str,
+        prompt: OllamaPrompt,
+        *,
+        small: bool = False,
+    ) -> tuple[BouncerResponse, str, dict]:
+        """One bouncer inference on *model_name*: (parsed result, raw reply, options).
+
+        *small* selects the first-pass schema, which adds ``confidence``.
+        """
+        # A small bouncer shared with the tagger keeps the tagger's num_ctx so
+        # ollama doesn't reload the runner between the two roles.
+        num_ctx = (
+            self._cfg.tagger_num_ctx
+            if model_name != self._cfg.bouncer_model and model_name == self._cfg.tagger_model
+            else self._cfg.bouncer_num_ctx
+        )
+        options = {
+            "temperature": self._cfg.bouncer_temperature,
+            "num_ctx": num_ctx,
+        }
+        async with self._lock.hold(PRIORITY_INTERACTIVE):
+            response = await self._client.chat(
+                model=model_name,
+                messages=[
+                    {"role": "system", "content": prompt.system},
+                    {"role": "user",   "content": prompt.user},
+                ],
+                format=SMALL_BOUNCER_SCHEMA if small else BOUNCER_SCHEMA,
+                keep_alive=self._cfg.keep_alive,
+                options=options,
+            )
+        raw_response = response.message.content or ""
+        response_model = SmallBouncerResponse if small else BouncerResponse
+        return response_model.model_validate_json(raw_response), raw_response, options
+
     # ------------------------------------------------------------------
     # Tagger
     # ------------------------------------------------------------------
 
     async def ask_tagger(self, content: str) -> list[str]:
-        """Generate 1-3 lowercase tags for a message."""
+        """Generate 1-3 lowercase tags for a message.
+
+        Calls that arrive within ``tagger_batch_window_seconds`` of each other
+        are coalesced (up to ``tagger_batch_max``) into one ask_tagger_batch()
+        inference, so a burst of messages costs one Tagger round trip.  A batch
+        is also flushed before its text would outgrow ``tagger_num_ctx``, and a
+        message too long to share a batch is tagged on its own.
+        """
+        cost = len(content) + _TAGGER_MESSAGE_OVERHEAD_CHARS
+        if self._cfg.tagger_batch_max <= 1 or cost > self._tagger_batch_budget:
+            return await self._ask_tagger_one(content)
+        if self._tagger_pending_chars + cost > self._tagger_batch_budget:
+            self._flush_tagger_pending()
+        fut: asyncio.Future[list[str]] = asyncio.get_running_loop().create_future()
+        self._tagger_pending.append((content, fut))
+        self._tagger_pending_chars += cost
+        if len(self._tagger_pending) >= self._cfg.tagger_batch_max:
+            self._flush_tagger_pending()
+        elif self._tagger_flush_timer is None:
+            self._tagger_flush_timer = asyncio.get_running_loop().call_later(
+                self._cfg.tagger_batch_window_seconds,
+                self._flush_tagger_pending,
+            )
+        return await fut
+
+    def _flush_tagger_pending(self) -> None:
+        """Hand everything queued by ask_tagger() to one background batch."""
+        if self._tagger_flush_timer is not None:
+            self._tagger_flush_timer.cancel()
+            self._tagger_flush_timer = None
+        batch, self._tagger_pending = self._tagger_pending, []
+        self._tagger_pending_chars = 0
+        if not batch:
+            return
+        task = asyncio.create_task(self._run_tagger_batch(batch))
+        self._tagger_tasks.add(task)
+        task.add_done_callback(self._tagger_tasks.discard)
+
+    async def _run_tagger_batch(
+        self,
+        batch: list[tuple[str, asyncio.Future[list[str]]]],
+    ) -> None:
+        results: list[list[str]] = [[] for _ in batch]
+        try:
+            results = await self.ask_tagger_batch([content for content, _ in batch])
+        except Exception as exc:
+            logger.error("Tagger batch failed (returning empty tags): %s", exc)
+        finally:
+            # Even if this task is cancelled, no ask_tagger() caller is left hanging.
+            for (_, fut), tags in zip(batch, results):
+                if not fut.done():
+                    fut.set_result(tags)
+
+    async def drain_tagger(self) -> None:
+        """Run any coalesced ask_tagger() calls now and wait for batches in flight.
+
+        Called on shutdown so no caller is left awaiting a batch that never runs.
+        """
+        self._flush_tagger_pending()
+        if self._tagger_tasks:
+            await asyncio.gather(*self._tagger_tasks, return_exceptions=True)
+
+    async def _ask_tagger_one(self, content: str) -> list[str]:
+        """One Tagger inference for one message (no coalescing)."""
         prompt = SandyPrompt.tagger_prompt(content)
+        if not await self._acquire_background("Tagger"):
+            return []
         try:
-            async with self._lock:
+            try:
                 response = await self._client.chat(
                     model=self._cfg.tagger_model,
                     messages=[
                         {"role": "system", "content": prompt.system},
                         {"role": "user",   "content": prompt.user},
                     ],
-                    format=TaggerResponse.model_json_schema(),
-                    keep_alive=self._cfg.keep_alive,
+                    format=TAGGER_SCHEMA,
+                    keep_alive=self._background_keep_alive(self._cfg.tagger_model),
                     options={
                         "temperature": self._cfg.tagger_temperature,
                         "num_ctx": self._cfg.tagger_num_ctx,
                     },
                 )
+            finally:
+                self._lock.release()
             result = TaggerResponse.model_validate_json(response.message.content)
             logger.debug("Tagger → tags=%r", result.tags)
             return result.tags
@@ -332,6 +626,52 @@ class OllamaInterface:
             logger.error("Tagger error (returning empty tags): %s", exc)
             return []
 
+    async def ask_tagger_batch(self, contents: list[str]) -> list[list[str]]:
+        """Tag several messages with one Tagger inference.
+
+        Returns one tag list per input, in order.  A single message gets a
+        plain single-message Tagger call; if the batched reply has the wrong
+        number of entries, every message falls back to its own call.
+        """
+        if not contents:
+            return []
+        if len(contents) == 1:
+            return [await self._ask_tagger_one(contents[0])]
+        prompt = SandyPrompt.tagger_batch_prompt(contents)
+        if not await self._acquire_background("Tagger batch"):
+            return [[] for _ in contents]
+        try:
+            try:
+                response = await self._client.chat(
+                    model=self._cfg.tagger_model,
+                    messages=[
+                        {"role": "system", "content": prompt.system},
+                        {"role": "user",   "content": prompt.user},
+                    ],
+                    format=TAGGER_BATCH_SCHEMA,
+                    keep_alive=self._background_keep_alive(self._cfg.tagger_model),
+                    options={
+                        "temperature": self._cfg.tagger_temperature,
+                        "num_ctx": self._cfg.tagger_num_ctx,
+                    },
+                )
+            finally:
+                self._lock.release()
+            result = TaggerBatchResponse.model_validate_json(response.message.content)
+        except Exception as exc:
+            logger.error("Tagger batch error (returning empty tags): %s", exc)
+            return [[] for _ in contents]
+        if len(result.messages) != len(contents):
+            logger.warning(
+                "Tagger batch returned %d entries for %d messages — tagging individually",
+                len(result.messages),
+                len(contents),
+            )
+            return [await self._ask_tagger_one(content) for content in contents]
+        tags = [entry.tags for entry in result.messages]
+        logger.debug("Tagger batch → %d message(s)", len(tags))
+        return tags
+
     # ------------------------------------------------------------------
     # Summarizer
     # ------------------------------------------------------------------
@@ -339,21 +679,25 @@ class OllamaInterface:
     async def ask_summarizer(self, content: str) -> str | None:
         """Summarise a (long) message in one or two sentences."""
         prompt = SandyPrompt.summarize_prompt(content)
+        if not await self._acquire_background("Summarizer"):
+            return None
         try:
-            async with self._lock:
+            try:
                 response = await self._client.chat(
                     model=self._cfg.summarizer_model,
                     messages=[
                         {"role": "system", "content": prompt.system},
                         {"role": "user",   "content": prompt.user},
                     ],
-                    format=SummarizerResponse.model_json_schema(),
-                    keep_alive=self._cfg.keep_alive,
+                    format=SUMMARIZER_SCHEMA,
+                    keep_alive=self._background_keep_alive(self._cfg.summarizer_model),
                     options={
                         "temperature": self._cfg.summarizer_temperature,
                         "num_ctx": self._cfg.summarizer_num_ctx,
                     },
                 )
+            finally:
+                self._lock.release()
             result = SummarizerResponse.model_validate_json(response.message.content)
             logger.debug("Summarizer → summary=%r", result.summary)
             return result.summary
@@ -375,8 +719,15 @@ class OllamaInterface:
         mode: str = "text",
         participant_names: list[str] | None = None,
         trace: TurnTrace | None = None,
+        stop_when: Callable[[str], bool] | None = None,
     ) -> BrainResponse | None:
-        """Generate a response from the Brain model."""
+        """Generate a response from the Brain model.
+
+        The reply is streamed from ollama.  If *stop_when* is given it is
+        called with the text so far after each chunk; returning True ends the
+        stream early (done_reason ``"stop_when"``), which stops generation on
+        the server and frees the lock for the next caller.
+        """
         if mode == "voice":
             prompt = SandyPrompt.voice_brain_prompt(
                 server_name=server_name,
@@ -398,26 +749,52 @@ class OllamaInterface:
             )
         if tool_context:
             system_content += "\n\n" + tool_context
-        full_messages = (
-            [{"role": "system", "content": system_content}]
-            + messages
-        )
+        # Built once per call: a single list with the system message in front
+        # of the caller's turns (no intermediate list from concatenation).
+        full_messages = [{"role": "system", "content": system_content}, *messages]
+        options = {
+            "temperature": self._cfg.brain_temperature,
+            "num_predict": num_predict,
+            "num_ctx":     self._cfg.brain_num_ctx,
+            # Pin the static persona prefix if ollama has to shift the
+            # context, so it stays in the KV cache instead of being evicted.
+            "num_keep":    _estimate_prefix_tokens(prompt.system),
+        }
         try:
-            async with self._lock:
-                response = await self._client.chat(
+            async with self._lock.hold(PRIORITY_BRAIN):
+                requested_at = time.perf_counter()
+                stream = await self._client.chat(
                     model=self._cfg.brain_model,
                     messages=full_messages,
                     keep_alive=self._cfg.keep_alive,
-                    options={
-                        "temperature": self._cfg.brain_temperature,
-                        "num_predict": num_predict,
-                        "num_ctx":     self._cfg.brain_num_ctx,
-                    },
+                    options=options,
+                    stream=True,
                 )
+                parts: list[str] = []
+                done_reason: str | None = None
+                eval_count: int | None = None
+                first_token_ms: int | None = None
+                try:
+                    async for chunk in stream:
+                        text = chunk.message.content or ""
+                        if text and first_token_ms is None:
+                            first_token_ms = int((time.perf_counter() - requested_at) * 1000)
+                        parts.append(text)
+                        if chunk.done:
+                            done_reason = chunk.done_reason
+                            eval_count = chunk.eval_count
+                        elif stop_when is not None and stop_when("".join(parts)):
+                            done_reason = "stop_when"
+                            break
+                finally:
+                    # Closing the stream drops the HTTP response, which is
+                    # how ollama learns to stop generating after an early exit.
+                    await stream.aclose()
             brain_response = BrainResponse(
-                content=response.message.content or "",
-                done_reason=response.done_reason,
-                eval_count=response.eval_count,
+                content="".join(parts),
+                done_reason=done_reason,
+                eval_count=eval_count,
+                first_token_ms=first_token_ms,
             )
             if trace is not None:
                 emit_forensic_record(
@@ -435,14 +812,11 @@ class OllamaInterface:
                         tool_context=tool_context,
                         mode=mode,
                         participant_names=participant_names,
-                        options={
-                            "temperature": self._cfg.brain_temperature,
-                            "num_predict": num_predict,
-                            "num_ctx": self._cfg.brain_num_ctx,
-                        },
+                        options=options,
                         raw_response=brain_response.content,
                         done_reason=brain_response.done_reason,
                         eval_count=brain_response.eval_count,
+                        first_token_ms=brain_response.first_token_ms,
                     ),
                 )
             return brain_response
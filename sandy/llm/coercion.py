@@ -12,7 +12,12 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
-_HISTORY_LINE_RE = re.compile(r"^\[[^\]]+\] \[[^\]]+\] (?P<content>.*)$")
+# Multiline so one finditer() pass walks the whole history block; the leading
+# [^\S\n]* stands in for the per-line strip().
+_HISTORY_LINE_RE = re.compile(
+    r"^[^\S\n]*\[[^\]\n]+\] \[[^\]\n]+\] (?P<content>.*)$",
+    re.MULTILINE,
+)
 
 _IMAGE_ASK_PATTERNS: tuple[str, ...] = (
     "this picture",
@@ -25,46 +30,91 @@ _IMAGE_ASK_PATTERNS: tuple[str, ...] = (
     "what do you think of that",
 )
 
+# Cues that the image-mentioning message is actually a question to Sandy.
+_IMAGE_ASK_CUES: tuple[str, ...] = ("?", "think", "look")
+
 _STEAM_CATEGORY_KEYWORDS: tuple[tuple[str, tuple[str, ...]], ...] = (
-    ("specials", ("on sale", "sales", "sale", "discount", "discounts")),
+    ("specials", ("on sale", "on-sale", "sale", "discount")),
     ("upcoming", ("coming soon", "upcoming")),
     ("new_releases", ("new releases", "new release", "just came out", "fresh release", "fresh releases")),
     ("top_sellers", ("top sellers", "top seller", "best sellers", "best seller", "what's good", "whats good", "what's hot", "whats hot", "selling well")),
 )
 
 
+def _compile_phrases(
+    phrases: tuple[str, ...],
+    *,
+    whole_words: bool = False,
+    word_start: bool = False,
+) -> re.Pattern[str]:
+    """Compile a phrase list into one alternation so a message is scanned once.
+
+    By default this has plain substring semantics, same as
+    ``any(p in text for p in phrases)``.  With *whole_words* each phrase must
+    start and end on a word boundary.  *word_start* only anchors the front,
+    so "sale" skips "wholesale" but "discount" still catches "discounted".
+    """
+    alternation = "|".join(re.escape(p) for p in sorted(phrases, key=len, reverse=True))
+    if whole_words:
+        return re.compile(rf"\b(?:{alternation})\b")
+    if word_start:
+        return re.compile(rf"\b(?:{alternation})")
+    return re.compile(alternation)
+
+
+_IMAGE_ASK_RE = _compile_phrases(_IMAGE_ASK_PATTERNS, whole_words=True)
+
+# Category order is priority order, so keep one pattern per category.
+_STEAM_CATEGORY_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+    (category, _compile_phrases(keywords, word_start=True))
+    for category, keywords in _STEAM_CATEGORY_KEYWORDS
+)
+
+# Follow-ups like "check actual steam" that reuse an earlier category.
+_STEAM_FOLLOWUP_RE = _compile_phrases(("steam", "check actual", "check again"))
+
+# Whole-message acknowledgements that never need a reply ("lol", "kk",
+# "hahaha", ...).  Trailing punctuation is allowed; anything else isn't.
+_TRIVIAL_MESSAGE_RE = re.compile(
+    r"(?:k+|ok(?:ay)?|nice|ya|yep|yup|nah|np|gg|same|mood|real|based"
+    r"|(?:lo)+l|l+m+f?a+o+|rofl|(?:ha)+h?|(?:he)+h?|x+d+)[\s.!~]*"
+)
+
+
 def _extract_history_messages(context: str) -> list[str]:
     """Return plain message text from Last10-formatted history lines."""
-    messages: list[str] = []
-    for line in context.splitlines():
-        match = _HISTORY_LINE_RE.match(line.strip())
-        if match:
-            messages.append(match.group("content").strip())
-    return messages
+    return [match.group("content").strip() for match in _HISTORY_LINE_RE.finditer(context)]
+
+
+def _lowered_history(context: str) -> list[str]:
+    """Lowercased history messages — computed once and shared by the checks below."""
+    return _extract_history_messages(context.lower())
 
 
 def _infer_steam_browse_category(context: str) -> str | None:
     """Infer the Steam storefront category implied by the latest turn."""
-    messages = _extract_history_messages(context)
-    if not messages:
+    return _steam_category_from_lowered(_lowered_history(context))
+
+
+def _steam_category_from_lowered(lowered_messages: list[str]) -> str | None:
+    if not lowered_messages:
         return None
-    lowered_messages = [message.lower() for message in messages]
     latest = lowered_messages[-1]
     recent_window = lowered_messages[-4:]
 
     if not any("steam" in message for message in recent_window):
         return None
 
-    for category, keywords in _STEAM_CATEGORY_KEYWORDS:
-        if any(keyword in latest for keyword in keywords):
+    for category, pattern in _STEAM_CATEGORY_PATTERNS:
+        if pattern.search(latest):
             return category
 
     # Follow-up turns like "check actual steam" need the most recent
     # storefront category from nearby history rather than a blind default.
-    if "steam" in latest or "check actual" in latest or "check again" in latest:
+    if _STEAM_FOLLOWUP_RE.search(latest):
         for message in reversed(lowered_messages[:-1]):
-            for category, keywords in _STEAM_CATEGORY_KEYWORDS:
-                if any(keyword in message for keyword in keywords):
+            for category, pattern in _STEAM_CATEGORY_PATTERNS:
+                if pattern.search(message):
                     return category
 
     if "steam" in latest:
@@ -73,17 +123,37 @@ def _infer_steam_browse_category(context: str) -> str | None:
 
 
 def _looks_like_direct_image_ask(context: str) -> bool:
-    messages = _extract_history_messages(context)
-    if not messages:
+    return _image_ask_from_lowered(_lowered_history(context))
+
+
+def _image_ask_from_lowered(lowered_messages: list[str]) -> bool:
+    if not lowered_messages:
         return False
 
-    latest = messages[-1].lower()
+    latest = lowered_messages[-1]
 
     if "sandy" not in latest:
         return False
-    if not any(pattern in latest for pattern in _IMAGE_ASK_PATTERNS):
+    if not _IMAGE_ASK_RE.search(latest):
+        return False
+    return any(cue in latest for cue in _IMAGE_ASK_CUES)
+
+
+def _is_trivial_latest_message(context: str) -> bool:
+    """True when the latest message is a bare acknowledgement or emoji-only.
+
+    These are cheap to recognise and the bouncer always declines them, so
+    ask_bouncer can answer without an LLM call.  Questions ("?") never count.
+    """
+    lines = _HISTORY_LINE_RE.findall(context)
+    if not lines:
+        return False
+    latest = lines[-1].strip().lower()
+    if not latest or "?" in latest:
         return False
-    return "?" in latest or "think" in latest or "look" in latest
+    if _TRIVIAL_MESSAGE_RE.fullmatch(latest):
+        return True
+    return not any(ch.isalnum() for ch in latest)
 
 
 def _coerce_bouncer_tool_selection(
@@ -91,9 +161,10 @@ def _coerce_bouncer_tool_selection(
     result: "BouncerResponse",
 ) -> "BouncerResponse":
     """Apply deterministic tool overrides for obvious storefront asks."""
+    lowered_messages = _lowered_history(context)
     if (
         not result.should_respond
-        and _looks_like_direct_image_ask(context)
+        and _image_ask_from_lowered(lowered_messages)
     ):
         logger.info("Bouncer image-ask override: forcing should_respond=True")
         result.should_respond = True
@@ -107,7 +178,7 @@ def _coerce_bouncer_tool_selection(
     if result.use_tool and result.recommended_tool not in {None, "search_web", "steam_browse"}:
         return result
 
-    category = _infer_steam_browse_category(context)
+    category = _steam_category_from_lowered(lowered_messages)
     if category is None:
         return result
 
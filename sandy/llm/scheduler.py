@@ -0,0 +1,97 @@
+"""Priority-aware lock guarding Sandy's ollama calls.
+
+OllamaInterface allows one inference at a time by default.  A plain
+asyncio.Lock grants it in FIFO order, which means a reply the user is
+waiting on can sit behind a queue of background tagger/summarizer calls.
+PriorityLock keeps the holder limit but, on release, hands the lock to the
+most urgent waiter instead of the oldest one.
+
+Lower numbers are more urgent; ties are served in arrival order.
+
+``slots`` (default 1) lets more than one holder in at once, for hosts where
+ollama runs with ``OLLAMA_NUM_PARALLEL`` > 1 and has the VRAM for it.
+Waiters are still admitted strictly by priority.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+#: Brain replies (text and voice) — someone is waiting on these.
+PRIORITY_BRAIN = 0
+#: Bouncer, vision, warm/unload — on the turn path but ahead of the brain.
+PRIORITY_INTERACTIVE = 1
+#: Tagger / summarizer — memory work nobody is waiting on.
+PRIORITY_BACKGROUND = 2
+
+
+class PriorityLock:
+    """Async lock (or small semaphore) whose waiters are served by priority."""
+
+    def __init__(self, slots: int = 1) -> None:
+        self._slots = max(1, slots)
+        self._in_use = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+
+    @property
+    def slots(self) -> int:
+        return self._slots
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    def locked(self) -> bool:
+        """True when every slot is taken and a new acquire() would wait."""
+        return self._in_use >= self._slots
+
+    async def acquire(self, priority: int = PRIORITY_INTERACTIVE) -> bool:
+        """Wait for a slot.  Safe to cancel (e.g. from asyncio.wait_for)."""
+        if self._in_use < self._slots:
+            self._in_use += 1
+            return True
+
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            # Cancelled after release() had already handed us the lock:
+            # pass it on rather than leaking it.
+            if fut.done() and not fut.cancelled():
+                self.release()
+            raise
+        return True
+
+    def release(self) -> None:
+        """Release a slot, handing it straight to the most urgent waiter."""
+        if self._in_use == 0:
+            raise RuntimeError("PriorityLock is not acquired")
+        while self._waiters:
+            _, _, fut = heapq.heappop(self._waiters)
+            if not fut.done():
+                # The slot transfers directly; _in_use is unchanged so a new
+                # arrival can't barge in ahead of the chosen waiter.
+                fut.set_result(None)
+                return
+        self._in_use -= 1
+
+    @asynccontextmanager
+    async def hold(self, priority: int = PRIORITY_INTERACTIVE) -> AsyncIterator[None]:
+        """``async with lock.hold(PRIORITY_BRAIN): ...``"""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.release()
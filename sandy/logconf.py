@@ -121,6 +121,20 @@ class _HttpxConsoleFilter(logging.Filter):
         return not (record.name == "httpx" and record.levelno < logging.WARNING)
 
 
+class _DeferredFormatQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records untouched so formatting happens on the listener thread.
+
+    The stock QueueHandler.prepare() runs ``self.format(record)`` (and the %
+    substitution) on the calling thread, then flattens msg/args/exc_info.
+    The queue here is in-process, so nothing needs to be pickled; handing the
+    record over as-is keeps that work off the event loop and lets each sink's
+    formatter see the original args and exc_info.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 class TraceStoreHandler(logging.Handler):
     """Persist structured trace events to a small local SQLite database."""
 
@@ -231,7 +245,7 @@ _trace_store_handler = TraceStoreHandler(_logs_dir() / "trace_events.db")
 _trace_store_handler.addFilter(_SinkFilter("trace_store"))
 
 _log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
-_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler = _DeferredFormatQueueHandler(_log_queue)
 _listener = logging.handlers.QueueListener(
     _log_queue,
     _console_handler,
@@ -78,7 +78,13 @@ class MemoryClient:
     # Public interface
     # ------------------------------------------------------------------
 
-    async def process_and_store(self, message: discord.Message, image_descriptions: list[str] | None = None) -> None:
+    async def process_and_store(
+        self,
+        message: discord.Message,
+        image_descriptions: list[str] | None = None,
+        *,
+        enrich: bool = True,
+    ) -> None:
         """Tag, optionally summarise, then persist one message.
 
         Intended to be run as a fire-and-forget background task after the
@@ -96,6 +102,10 @@ class MemoryClient:
         the stored content so Recall and RAG embed the image context rather
         than empty string.  The real message object is still used for all
         metadata (author, channel, guild, id).
+
+        enrich — False skips the tagger and summarizer and archives the
+        message as-is (the memory worker's overflow path when its queue is
+        full).
         """
         result = await self._process_payload(
             discord_message_id=message.id,
@@ -108,6 +118,7 @@ class MemoryClient:
             base_content=message.content or "",
             timestamp=message.created_at,
             image_descriptions=image_descriptions,
+            enrich=enrich,
         )
         logger.info(
             "Stored message from %s in %s/%s — tags=%r summary=%s vector=%s recall=%s",
@@ -209,7 +220,7 @@ class MemoryClient:
         Use process_and_store() for the full tag+summarize+store pipeline.
         Returns True on success. Raises on any store error.
         """
-        return self._store_recall(message, tags=None, summary=None)
+        return self._store_recall_bare(message)
 
     async def store_message_with_tags(
         self,
@@ -352,6 +363,7 @@ class MemoryClient:
         timestamp: datetime,
         image_descriptions: list[str] | None = None,
         allow_existing_recall: bool = False,
+        enrich: bool = True,
     ) -> dict[str, object]:
         tags: list[str] = []
         summary: str | None = None
@@ -360,7 +372,7 @@ class MemoryClient:
             image_descriptions=image_descriptions,
         )
 
-        if self._llm is not None and content_for_storage:
+        if enrich and self._llm is not None and content_for_storage:
             tags, summary = await self._generate_tags_and_summary(
                 discord_message_id=discord_message_id,
                 server_name=server_name,
@@ -368,10 +380,6 @@ class MemoryClient:
                 content_for_storage=content_for_storage,
             )
 
-        recall_stored = False
-        vector_stored = False
-        vector_error: Exception | None = None
-
         payload = SimpleNamespace(
             id=discord_message_id,
             created_at=timestamp,
@@ -381,50 +389,84 @@ class MemoryClient:
             content=base_content,
         )
 
-        try:
-            vector_stored = await self._store_vector(
+        # Vector and Recall writes have no ordering dependency, so run them
+        # side by side. Each helper catches and logs its own failure.
+        (vector_stored, vector_error), recall_stored = await asyncio.gather(
+            self._try_store_vector(payload, content=content_for_storage),
+            self._try_store_recall(
                 payload,
-                content=content_for_storage,
-            )
+                tags=tags,
+                summary=summary,
+                content_for_storage=content_for_storage,
+                allow_existing_recall=allow_existing_recall,
+            ),
+        )
+
+        return {
+            "tags": tags,
+            "summary": summary,
+            "vector_stored": vector_stored,
+            "recall_stored": recall_stored,
+            "vector_error": vector_error,
+        }
+
+    async def _try_store_vector(
+        self,
+        payload: SimpleNamespace,
+        *,
+        content: str,
+    ) -> tuple[bool, Exception | None]:
+        """Store in vector memory, returning (stored, error) instead of raising."""
+        try:
+            return await self._store_vector(payload, content=content), None
         except Exception as exc:
-            vector_error = exc
             logger.error(
                 "Vector store failed for message %s in %s/%s: %s",
-                discord_message_id,
-                server_name,
-                channel_name,
+                payload.id,
+                payload.guild.name,
+                payload.channel.name,
                 exc,
             )
+            return False, exc
 
-        try:
-            existing = None
+    async def _try_store_recall(
+        self,
+        payload: SimpleNamespace,
+        *,
+        tags: list[str],
+        summary: str | None,
+        content_for_storage: str,
+        allow_existing_recall: bool,
+    ) -> bool:
+        """Store in Recall (off the event loop), logging failures and returning False."""
+
+        def _store() -> bool:
             if allow_existing_recall:
-                existing = self._db.get_message_by_discord_id(discord_message_id)
-            if existing is None:
-                recall_stored = self._store_recall(
+                if self._db.get_message_by_discord_id(payload.id) is not None:
+                    return True
+            if tags or summary is not None:
+                return self._store_recall(
                     payload,
                     tags=tags or None,
                     summary=summary,
                     content_override=content_for_storage or None,
                 )
-            else:
-                recall_stored = True
+            return self._store_recall_bare(
+                payload,
+                content_override=content_for_storage or None,
+            )
+
+        try:
+            return await asyncio.to_thread(_store)
         except Exception as exc:
             logger.error(
                 "Recall store failed for message %s in %s/%s: %s",
-                discord_message_id,
-                server_name,
-                channel_name,
+                payload.id,
+                payload.guild.name,
+                payload.channel.name,
                 exc,
             )
-
-        return {
-            "tags": tags,
-            "summary": summary,
-            "vector_stored": vector_stored,
-            "recall_stored": recall_stored,
-            "vector_error": vector_error,
-        }
+            return False
 
     async def _generate_tags_and_summary(
         self,
@@ -434,11 +476,39 @@ class MemoryClient:
         channel_name: str,
         content_for_storage: str,
     ) -> tuple[list[str], str | None]:
-        tags: list[str] = []
-        summary: str | None = None
+        """Run the tagger and (for long content) the summarizer concurrently.
+
+        The shared LLM lock still serialises the actual inference; issuing
+        both up front just removes the scheduling gap between them.
+        """
+        tagger = self._tag_content(
+            discord_message_id=discord_message_id,
+            server_name=server_name,
+            channel_name=channel_name,
+            content_for_storage=content_for_storage,
+        )
+        if len(content_for_storage) <= self.SUMMARIZE_THRESHOLD:
+            return await tagger, None
+        summarizer = self._summarize_content(
+            discord_message_id=discord_message_id,
+            server_name=server_name,
+            channel_name=channel_name,
+            content_for_storage=content_for_storage,
+        )
+        tags, summary = await asyncio.gather(tagger, summarizer)
+        return tags, summary
+
+    async def _tag_content(
+        self,
+        *,
+        discord_message_id: int,
+        server_name: str,
+        channel_name: str,
+        content_for_storage: str,
+    ) -> list[str]:
         try:
             tags = await self._llm.ask_tagger(content_for_storage)
-            tags = [t.lstrip("-—") for t in tags]
+            return [t.lstrip("-—") for t in tags]
         except Exception as exc:
             logger.error(
                 "Tagger failed for message %s in %s/%s: %s",
@@ -447,21 +517,27 @@ class MemoryClient:
                 channel_name,
                 exc,
             )
-            tags = []
-
-        if len(content_for_storage) > self.SUMMARIZE_THRESHOLD:
-            try:
-                summary = await self._llm.ask_summarizer(content_for_storage)
-            except Exception as exc:
-                logger.error(
-                    "Summarizer failed for message %s in %s/%s: %s",
-                    discord_message_id,
-                    server_name,
-                    channel_name,
-                    exc,
-                )
-                summary = None
-        return tags, summary
+            return []
+
+    async def _summarize_content(
+        self,
+        *,
+        discord_message_id: int,
+        server_name: str,
+        channel_name: str,
+        content_for_storage: str,
+    ) -> str | None:
+        try:
+            return await self._llm.ask_summarizer(content_for_storage)
+        except Exception as exc:
+            logger.error(
+                "Summarizer failed for message %s in %s/%s: %s",
+                discord_message_id,
+                server_name,
+                channel_name,
+                exc,
+            )
+            return None
 
     def _store_recall(
         self,
@@ -494,6 +570,31 @@ class MemoryClient:
         self._db.create_message(msg)
         return True
 
+    def _store_recall_bare(
+        self,
+        message: discord.Message,
+        content_override: str | None = None,
+    ) -> bool:
+        """Insert one message into Recall with no tags or summary.
+
+        This is the common path (no LLM, or the tagger came back empty), so it
+        skips the tag/summary fields entirely and lets the model defaults apply.
+        Same return/raise contract as _store_recall().
+        """
+        msg = ChatMessageCreate(
+            discord_message_id=message.id,
+            author_id=message.author.id,
+            author_name=message.author.display_name,
+            channel_id=message.channel.id,
+            channel_name=message.channel.name,
+            server_id=message.guild.id,
+            server_name=message.guild.name,
+            content=content_override or message.content or "(no text content)",
+            timestamp=message.created_at,
+        )
+        self._db.create_message(msg)
+        return True
+
     async def _store_vector(
         self,
         message: discord.Message,
@@ -10,6 +10,7 @@ Public API:
 
 from __future__ import annotations
 
+import functools
 import os
 from typing import TYPE_CHECKING
 
@@ -115,7 +116,12 @@ def build_pipeline(
         )
 
     cache = Last10(maxlen=10, registry=registry)
-    memory_worker = MemoryWorker(memory.process_and_store, runtime_state=runtime_state)
+    memory_worker = MemoryWorker(
+        memory.process_and_store,
+        overflow_handler=functools.partial(memory.process_and_store, enrich=False),
+        runtime_state=runtime_state,
+        burst=llm.tagger_batch_max,
+    )
 
     pipeline = SandyPipeline(
         background_tasks=background_tasks,
@@ -1,5 +1,6 @@
 """Attachment preparation, vision captioning, and augmented content building."""
 
+import asyncio
 import io
 from dataclasses import dataclass
 
@@ -183,6 +184,15 @@ async def describe_prepared_attachments(prepared: AttachmentPreparationResult, l
     fallback_reasons: list[str] = []
     ask = llm.ask_vision if detail else llm.ask_vision_router
 
+    # Issue every image's vision call together rather than one after another.
+    # They still queue on the LLM lock, but overlap when LLM_PARALLEL_SLOTS > 1.
+    vision_results = iter(await asyncio.gather(*(
+        ask(prepared_attachment.image_bytes)
+        for prepared_attachment in prepared.attachments
+        if prepared_attachment.fallback_description is None
+        and prepared_attachment.image_bytes is not None
+    )))
+
     for prepared_attachment in prepared.attachments:
         if prepared_attachment.fallback_description is not None:
             descriptions.append(prepared_attachment.fallback_description)
@@ -195,7 +205,7 @@ async def describe_prepared_attachments(prepared: AttachmentPreparationResult, l
             fallback_reasons.append("missing_image_bytes")
             continue
 
-        desc = await ask(prepared_attachment.image_bytes)
+        desc = next(vision_results)
         if desc:
             descriptions.append(desc)
             logger.info(
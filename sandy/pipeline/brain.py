@@ -128,6 +128,7 @@ async def run_brain(
         "brain_completed",
         duration_ms=int((time.perf_counter() - brain_started) * 1000),
         done_reason=brain_response.done_reason if brain_response else None,
+        first_token_ms=brain_response.first_token_ms if brain_response else None,
         reply_chars=len((brain_response.content if brain_response else "") or ""),
     )
 
@@ -1,4 +1,4 @@
-"""Serialize deferred memory work behind a small in-process queue."""
+"""Run deferred memory work from a bounded in-process queue, in bursts."""
 
 import asyncio
 
@@ -11,41 +11,86 @@ logger = get_logger("sandy.bot")
 
 
 class MemoryWorker:
-    """Serialize deferred memory work behind a small in-process queue."""
+    """Run deferred memory work from a bounded in-process queue, off the reply path.
+
+    The queue is bounded so a stalled LLM can't make it grow without limit.
+    enqueue() never waits: the caller sits on the reply path.  When the
+    queue is full the message is handed to ``overflow_handler`` in the
+    background instead, which archives it without the tagger/summarizer
+    steps, and is counted in ``overflowed``.  Only with no overflow handler
+    is the message dropped from memory.
+
+    With ``burst`` > 1 the worker takes up to that many already-queued
+    messages at once and handles them concurrently, which lets their tagger
+    calls coalesce into one batched inference.  It never waits for a burst
+    to fill; a lone message is handled straight away.
+    """
 
     _SENTINEL = object()
 
-    def __init__(self, handler, *, runtime_state: RuntimeState | None = None) -> None:
+    #: Default upper bound on queued-but-unprocessed messages.
+    DEFAULT_MAXSIZE = 256
+
+    def __init__(
+        self,
+        handler,
+        *,
+        overflow_handler=None,
+        runtime_state: RuntimeState | None = None,
+        maxsize: int = DEFAULT_MAXSIZE,
+        burst: int = 1,
+    ) -> None:
         self._handler = handler
+        self._overflow_handler = overflow_handler
+        self._overflow_tasks: set[asyncio.Task[None]] = set()
         self._runtime_state = runtime_state
-        self._queue: asyncio.Queue[object] = asyncio.Queue()
+        self._burst = max(1, burst)
+        self._queue: asyncio.Queue[object] = asyncio.Queue(maxsize=maxsize)
         self._closed = False
+        self._overflowed = 0
+
+    @property
+    def overflowed(self) -> int:
+        """Messages that found the queue full (archived unenriched, or dropped)."""
+        return self._overflowed
 
     async def run(self) -> None:
         logger.info("Memory worker started")
         while True:
-            item = await self._queue.get()
-            try:
-                if item is self._SENTINEL:
-                    logger.info("Memory worker stopping")
-                    return
-
-                message, image_descriptions = item
-                if self._runtime_state is not None:
-                    self._runtime_state.memory_processing_started(
-                        message_id=getattr(message, "id", None),
-                    )
+            batch = [await self._queue.get()]
+            while len(batch) < self._burst and batch[-1] is not self._SENTINEL:
                 try:
-                    await self._handler(message, image_descriptions=image_descriptions)
-                except Exception:
-                    logger.exception("Memory worker handler failed for message %s", getattr(message, "id", "?"))
-                finally:
-                    if self._runtime_state is not None:
-                        self._runtime_state.memory_processing_finished(
-                            message_id=getattr(message, "id", None),
-                        )
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                items = [item for item in batch if item is not self._SENTINEL]
+                if len(items) == 1:
+                    await self._process(items[0])
+                elif items:
+                    await asyncio.gather(*(self._process(item) for item in items))
             finally:
-                self._queue.task_done()
+                for _ in batch:
+                    self._queue.task_done()
+            if batch[-1] is self._SENTINEL:
+                logger.info("Memory worker stopping")
+                return
+
+    async def _process(self, item) -> None:
+        message, image_descriptions = item
+        if self._runtime_state is not None:
+            self._runtime_state.memory_processing_started(
+                message_id=getattr(message, "id", None),
+            )
+        try:
+            await self._handler(message, image_descriptions=image_descriptions)
+        except Exception:
+            logger.exception("Memory worker handler failed for message %s", getattr(message, "id", "?"))
+        finally:
+            if self._runtime_state is not None:
+                self._runtime_state.memory_processing_finished(
+                    message_id=getattr(message, "id", None),
+                )
 
     async def enqueue(
         self,
@@ -54,14 +99,44 @@ class MemoryWorker:
     ) -> None:
         if self._closed:
             raise RuntimeError("Memory worker is closed")
-        await self._queue.put((message, image_descriptions))
+        try:
+            self._queue.put_nowait((message, image_descriptions))
+        except asyncio.QueueFull:
+            self._overflowed += 1
+            if self._overflow_handler is None:
+                logger.warning(
+                    "Memory queue full (%d pending) — dropping message %s (%d overflowed so far)",
+                    self._queue.qsize(),
+                    getattr(message, "id", "?"),
+                    self._overflowed,
+                )
+                return
+            logger.warning(
+                "Memory queue full (%d pending) — archiving message %s without tags/summary "
+                "(%d overflowed so far)",
+                self._queue.qsize(),
+                getattr(message, "id", "?"),
+                self._overflowed,
+            )
+            task = asyncio.create_task(self._run_overflow(message, image_descriptions))
+            self._overflow_tasks.add(task)
+            task.add_done_callback(self._overflow_tasks.discard)
+            return
         if self._runtime_state is not None:
             self._runtime_state.memory_enqueued()
 
+    async def _run_overflow(self, message, image_descriptions: list[str] | None) -> None:
+        try:
+            await self._overflow_handler(message, image_descriptions=image_descriptions)
+        except Exception:
+            logger.exception("Memory overflow handler failed for message %s", getattr(message, "id", "?"))
+
     async def shutdown(self) -> None:
         if self._closed:
             return
 
         self._closed = True
         await self._queue.join()
+        if self._overflow_tasks:
+            await asyncio.gather(*self._overflow_tasks)
         await self._queue.put(self._SENTINEL)
@@ -75,6 +75,7 @@ class SandyPipeline:
         self._cache_seeded = False
         self._memory_worker_task: asyncio.Task | None = None
         self._deferred_drain_task: asyncio.Task | None = None
+        self._heartbeat_task: asyncio.Task | None = None
 
     # -- Delegate methods for test monkeypatching compatibility --
 
@@ -117,6 +118,7 @@ class SandyPipeline:
                 guild_count += 1
             ready_info += f"      * {bot.user.name} is on {guild_count} servers\n"
             logger.warning("\n\n%s", ready_info)
+        self._maybe_start_heartbeat()
         await self._maybe_start_deferred_drain()
 
     async def handle_control_message(self, message: discord.Message, *, bot_user) -> bool:
@@ -140,6 +142,25 @@ class SandyPipeline:
             name="deferred-message-drain",
         )
 
+    def _maybe_start_heartbeat(self) -> None:
+        interval = getattr(self.llm, "heartbeat_seconds", 0)
+        if not interval:
+            return
+        if self._heartbeat_task is not None and not self._heartbeat_task.done():
+            return
+        self._heartbeat_task = self.background_tasks.create_task(
+            self._run_heartbeat(interval),
+            name="model-heartbeat",
+        )
+
+    async def _run_heartbeat(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            # Voice mode deliberately unloads the text-side models.
+            if self.voice.is_active():
+                continue
+            await self.llm.heartbeat()
+
     async def _run_deferred_drain_until_empty(self) -> None:
         while not self.voice.is_active():
             processed = await self.memory.drain_deferred_messages()
@@ -329,25 +350,30 @@ class SandyPipeline:
             # 9-12. Reply pipeline (only if bouncer said yes)
             if bouncer_result.should_respond:
                 async with message.channel.typing():
-                    # 9. Tool dispatch
-                    tool_context = await run_tool_dispatch(
-                        self.tools_module,
-                        message=message,
-                        bouncer_result=bouncer_result,
-                        trace=trace,
-                        runtime_state=self.runtime_state,
-                    )
-
-                    # 10. RAG retrieval
+                    # 9-10. Tool dispatch + RAG retrieval. Retrieval only
+                    # depends on which tool was picked, not on its result,
+                    # so the two I/O-bound steps run concurrently.  Neither
+                    # holds the LLM lock (it is only taken inside each
+                    # OllamaInterface call), so queued tagger/summarizer
+                    # work can use the GPU while they run.
                     ollama_history = history.to_ollama_messages(bot_user.id)
-                    rag_context = await run_retrieval(
-                        self.vector_memory,
-                        rag_query_text=rag_query_text,
-                        server_id=message.guild.id,
-                        ollama_history=ollama_history,
-                        recommended_tool=bouncer_result.recommended_tool,
-                        trace=trace,
-                        runtime_state=self.runtime_state,
+                    tool_context, rag_context = await asyncio.gather(
+                        run_tool_dispatch(
+                            self.tools_module,
+                            message=message,
+                            bouncer_result=bouncer_result,
+                            trace=trace,
+                            runtime_state=self.runtime_state,
+                        ),
+                        run_retrieval(
+                            self.vector_memory,
+                            rag_query_text=rag_query_text,
+                            server_id=message.guild.id,
+                            ollama_history=ollama_history,
+                            recommended_tool=bouncer_result.recommended_tool,
+                            trace=trace,
+                            runtime_state=self.runtime_state,
+                        ),
                     )
 
                     # 11. Brain generation + finalization
@@ -412,3 +438,6 @@ class SandyPipeline:
     async def shutdown(self) -> None:
         await self.voice.shutdown()
         await self.memory_worker.shutdown()
+        await self.llm.drain_tagger()
+        await self.vector_memory.aclose()
+        await self.tools_module.close_http_client()
@@ -54,10 +54,11 @@ async def run_tool_dispatch(
         )
         return None
 
+    tool_parameters = bouncer_result.tool_parameters or {}
     logger.debug(
         "Dispatching tool %s with params %s",
         bouncer_result.recommended_tool,
-        bouncer_result.tool_parameters or {},
+        tool_parameters,
     )
     tool_started = time.perf_counter()
     runtime_state.update_turn_stage(trace, "tool_started")
@@ -68,7 +69,7 @@ async def run_tool_dispatch(
     )
     tool_result = await tools_module.dispatch(
         bouncer_result.recommended_tool,
-        bouncer_result.tool_parameters or {},
+        tool_parameters,
         server_id=message.guild.id,
         server_name=message.guild.name,
     )
@@ -79,18 +80,16 @@ async def run_tool_dispatch(
         tool_name=bouncer_result.recommended_tool,
         result_chars=len(tool_result or ""),
     )
+    tool_context = format_tool_context(
+        bouncer_result.recommended_tool,
+        tool_result,
+    )
     forensic_event(
         trace,
         "tool_call",
         tool_name=bouncer_result.recommended_tool,
-        arguments=bouncer_result.tool_parameters or {},
+        arguments=tool_parameters,
         result=tool_result,
-        tool_context=format_tool_context(
-            bouncer_result.recommended_tool,
-            tool_result,
-        ),
-    )
-    return format_tool_context(
-        bouncer_result.recommended_tool,
-        tool_result,
+        tool_context=tool_context,
     )
+    return tool_context
@@ -1,4 +1,6 @@
 
+import functools
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -12,22 +14,79 @@ _PROMPTS_DIR = Path(__file__).parent / "prompts"
 logger = get_logger(__name__)
 
 
+# Prompt files are read from disk once per process and every system prompt is
+# a fixed string, so the per-call work is only the short user message.
+# Keeping the system text byte-identical between calls also lets ollama reuse
+# the prefix it already has cached.  (Edits to prompts/*.txt need a restart.)
+@functools.cache
 def _load(name: str) -> str:
     """Load a prompt text file from the prompts/ directory."""
     return (_PROMPTS_DIR / name).read_text()
 
 
-@dataclass
+def _brain_system() -> str:
+    return _load("brain_system.txt")
+
+
+@functools.cache
+def _voice_brain_system() -> str:
+    return f"{_brain_system()}\n\n{_load('voice_addendum.txt')}"
+
+
+@functools.cache
+def _bouncer_system(confidence_below: float | None) -> str:
+    system = _load("bouncer_system.txt")
+    if confidence_below is None:
+        return system
+    return (
+        f"{system}\n"
+        "Also set confidence to a number from 0.0 to 1.0 for how sure you are about the "
+        f"respond decision. Use values below {confidence_below:g} whenever the call is borderline.\n"
+    )
+
+
+# Prompts only show the time to the minute, so the zoneinfo conversion and
+# strftime run once per wall-clock minute.  (UTC offsets are whole minutes,
+# so epoch minutes line up with local minutes.)
+@functools.lru_cache(maxsize=1)
+def _format_minute(epoch_minute: int) -> str:
+    return datetime.fromtimestamp(epoch_minute * 60, _PACIFIC).strftime("%Y-%m-%d %H:%M %Z")
+
+
+def _now_minute() -> str:
+    return _format_minute(int(time.time() // 60))
+
+
+@dataclass(frozen=True, slots=True)
 class OllamaPrompt:
     """Container for an ollama chat prompt.
 
     system  — the SYSTEM role message (instructions / persona)
     user    — the USER role message (the actual input to reason over)
+
+    Frozen so prompts with no per-call input can be built once and shared.
     """
     system: str
     user: str
 
 
+# The brain user message depends only on the channel and the minute, so
+# turns in a busy channel reuse one prompt object until the clock ticks over.
+@functools.lru_cache(maxsize=64)
+def _brain_prompt_for(server_name: str, channel_name: str, now: str) -> OllamaPrompt:
+    # Per-channel text first, the timestamp last: everything up to the time
+    # stays byte-identical between turns in a channel, so ollama can reuse
+    # more of its cached prefix.
+    user = (
+        f"You are in channel {channel_name} in server {server_name}.\n\n"
+        "You have read the recent messages in this channel and have decided to say something.\n"
+        "Below are the conversation history, memory fragments, and other information you need "
+        "in order to formulate a response.\n\n"
+        f"The current time is {now}."
+    )
+    return OllamaPrompt(system=_brain_system(), user=user)
+
+
 class SandyPrompt:
     """Factory for all prompts used by Sandy's LLM roles.
 
@@ -42,16 +101,7 @@ class SandyPrompt:
         channel_name: str = "general",
     ) -> OllamaPrompt:
         """Main personality prompt for the Brain model."""
-        system = _load("brain_system.txt")
-        now = datetime.now(_PACIFIC).strftime("%Y-%m-%d %H:%M %Z")
-        user = (
-            f"The current time is {now}.\n"
-            f"You are in channel {channel_name} in server {server_name}.\n\n"
-            "You have read the recent messages in this channel and have decided to say something.\n"
-            "Below are the conversation history, memory fragments, and other information you need "
-            "in order to formulate a response."
-        )
-        return OllamaPrompt(system=system, user=user)
+        return _brain_prompt_for(server_name, channel_name, _now_minute())
 
     @staticmethod
     def voice_brain_prompt(
@@ -59,30 +109,27 @@ class SandyPrompt:
         channel_name: str = "voice",
         participant_names: list[str] | None = None,
     ) -> OllamaPrompt:
-        base = SandyPrompt.brain_prompt(
-            server_name=server_name,
-            channel_name=channel_name,
-        )
-        voice_addendum = _load("voice_addendum.txt")
         participants = ", ".join(participant_names or []) or "no one else right now"
-        system = f"{base.system}\n\n{voice_addendum}"
+        system = _voice_brain_system()
         user = (
-            f"The current time is {datetime.now(_PACIFIC).strftime('%Y-%m-%d %H:%M %Z')}.\n"
             f"You are in the live voice channel {channel_name} in server {server_name}.\n"
             f"People currently in the call: {participants}.\n"
             "You have the recent voice-session context, any relevant long-term memories, "
-            "and the latest completed human turns."
+            "and the latest completed human turns.\n\n"
+            f"The current time is {_now_minute()}."
         )
         return OllamaPrompt(system=system, user=user)
 
     @staticmethod
-    def bouncer_prompt(context: str) -> OllamaPrompt:
+    def bouncer_prompt(context: str, *, confidence_below: float | None = None) -> OllamaPrompt:
         """Prompt for the Bouncer model.
 
-        context  — the output of ChannelHistory.format(), oldest → newest,
-                   with the last line being the message under consideration.
+        context           — the output of ChannelHistory.format(), oldest → newest,
+                            with the last line being the message under consideration.
+        confidence_below  — set for the small first-pass bouncer: also ask for a
+                            confidence score, borderline calls below this value.
         """
-        system = _load("bouncer_system.txt")
+        system = _bouncer_system(confidence_below)
         user = (
             "Here is the recent channel history (oldest first, most recent last):\n\n"
             f"{context}\n\n"
@@ -98,6 +145,20 @@ class SandyPrompt:
         user = f"Generate 1-3 tags for this Discord message:\n\n{content}"
         return OllamaPrompt(system=system, user=user)
 
+    @staticmethod
+    def tagger_batch_prompt(contents: list[str]) -> OllamaPrompt:
+        """Prompt for tagging several messages in one Tagger call."""
+        system = _load("tagger_system.txt")
+        numbered = "\n\n".join(
+            f"Message {i}:\n{content}" for i, content in enumerate(contents, 1)
+        )
+        user = (
+            f"Generate 1-3 tags for each of these {len(contents)} Discord messages. "
+            "Return exactly one entry per message, in the same order:\n\n"
+            f"{numbered}"
+        )
+        return OllamaPrompt(system=system, user=user)
+
     @staticmethod
     def summarize_prompt(content: str) -> OllamaPrompt:
         """Prompt for the Summarizer model."""
@@ -106,6 +167,7 @@ class SandyPrompt:
         return OllamaPrompt(system=system, user=user)
 
     @staticmethod
+    @functools.cache
     def vision_router_prompt() -> OllamaPrompt:
         """Prompt for the cheap pre-bouncer vision caption."""
         system = _load("vision_router_system.txt")
@@ -116,6 +178,7 @@ class SandyPrompt:
         return OllamaPrompt(system=system, user=user)
 
     @staticmethod
+    @functools.cache
     def vision_detail_prompt() -> OllamaPrompt:
         """Prompt for the detailed vision grounding path."""
         system = _load("vision_detail_system.txt")
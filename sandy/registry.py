@@ -13,6 +13,12 @@ the discord API to get this info.
 
 import sqlite3
 import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
 
 import discord
 from dotenv import load_dotenv
@@ -24,6 +30,31 @@ load_dotenv()
 
 logger = get_logger(__name__)
 
+_SERVER_SEEN = "SELECT 1 FROM servers WHERE server_id = ?"
+_CHANNEL_SEEN = "SELECT 1 FROM channels WHERE channel_id = ?"
+_USER_SEEN = "SELECT 1 FROM users WHERE user_id = ?"
+_INSERT_SERVER = "INSERT OR IGNORE INTO servers (server_id, server_name) VALUES (?, ?)"
+_INSERT_CHANNEL = "INSERT OR IGNORE INTO channels (channel_id, channel_name, server_id) VALUES (?, ?, ?)"
+_INSERT_USER = "INSERT OR IGNORE INTO users (user_id, user_name) VALUES (?, ?)"
+# Upsert so nickname changes are picked up over time.
+_UPSERT_NICKNAME = """
+    INSERT INTO user_nicknames (user_id, server_id, nickname)
+    VALUES (?, ?, ?)
+    ON CONFLICT(user_id, server_id) DO UPDATE SET nickname = excluded.nickname
+"""
+
+# ensure_seen() remembers this many (server, channel, user) -> nickname
+# entries before starting over.
+_SEEN_CACHE_MAX = 10_000
+
+# Pairs per get_user_infos() query; two bound parameters each keeps this well
+# under SQLite's host-parameter limit.
+_BULK_LOOKUP_CHUNK = 400
+
+# get_user_infos() remembers this many (user, server) answers for this long.
+_USER_INFO_CACHE_MAX = 4096
+_USER_INFO_TTL_SECONDS = 300.0
+
 
 class Registry:
     """
@@ -36,17 +67,60 @@ class Registry:
             db_dir = resolve_runtime_path(os.getenv("DB_DIR", "data/prod/"))
             db_path = str(db_dir / os.getenv("SERVER_DB_NAME", "server.db"))
         self.db_path = db_path
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        # One long-lived connection rather than one per call: ensure_seen
+        # alone runs several statements per message.  Callers come from the
+        # event loop, asyncio.to_thread workers and the API thread, so every
+        # write goes through _get_conn(), which serialises on _lock.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row  # rows behave like dicts
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute("PRAGMA temp_store = MEMORY")
+        self._conn.execute("PRAGMA cache_size = -20000")  # ~20 MB page cache
+        self._conn.execute("PRAGMA mmap_size = 67108864")  # 64 MB
+        self._seen: dict[tuple[int, int, int], str | None] = {}
+        self._user_info_lock = threading.Lock()
+        self._user_info_cache: OrderedDict[tuple[int, int], tuple[float, dict | None]] = OrderedDict()
         self._initialize_db()
+        # Lookups go through a second, read-only connection with its own
+        # lock: under WAL a reader never waits on the writer (or the other
+        # way round), so presence checks and nickname lookups from tool
+        # threads don't queue behind ensure_seen().
+        self._ro_lock = threading.Lock()
+        self._ro_conn = sqlite3.connect(
+            f"{Path(self.db_path).resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            isolation_level=None,  # autocommit: never pin an old snapshot
+            cached_statements=256,
+        )
+        self._ro_conn.row_factory = sqlite3.Row
+        self._ro_cursor = self._ro_conn.cursor()
+        self._ro_conn.execute("PRAGMA cache_size = -20000")
+        self._ro_conn.execute("PRAGMA mmap_size = 67108864")
 
-    def _get_conn(self) -> sqlite3.Connection:
-        """Return a connection with foreign keys enabled and row_factory set."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # rows behave like dicts
-        conn.execute("PRAGMA foreign_keys = ON")
-        return conn
+    @contextmanager
+    def _get_conn(self) -> Iterator[sqlite3.Connection]:
+        """Hold the shared connection for one transaction (commits on success)."""
+        with self._lock, self._conn:
+            yield self._conn
+
+    @contextmanager
+    def _read_conn(self) -> Iterator[sqlite3.Connection]:
+        """Hold the read-only connection for a lookup."""
+        with self._ro_lock:
+            yield self._ro_conn
+
+    def close(self) -> None:
+        with self._ro_lock:
+            self._ro_conn.close()
+        with self._lock:
+            self._conn.close()
 
     def _initialize_db(self) -> None:
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         with self._get_conn() as conn:
             conn.execute(
                 """
@@ -91,7 +165,14 @@ class Registry:
                 "voice_admin",
                 "INTEGER NOT NULL DEFAULT 0",
             )
-            conn.commit()
+            # Per-server lookups (channels of a server, everyone's nickname in
+            # a server) would otherwise scan the whole table.
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_channels_server ON channels(server_id)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_nick_server ON user_nicknames(server_id)"
+            )
 
     def _ensure_user_nicknames_column(
         self,
@@ -114,32 +195,23 @@ class Registry:
     # Presence checks
     # ------------------------------------------------------------------
 
+    def _exists(self, sql: str, key: int) -> bool:
+        with self._read_conn():
+            # fetchall() steps the statement to completion, so the shared
+            # cursor never pins a read snapshot between calls.
+            return bool(self._ro_cursor.execute(sql, (key,)).fetchall())
+
     def server_seen(self, message: discord.Message) -> bool:
         """Return True if the guild from this message is already in the database."""
-        with self._get_conn() as conn:
-            row = conn.execute(
-                "SELECT 1 FROM servers WHERE server_id = ?",
-                (message.guild.id,)
-            ).fetchone()
-        return row is not None
+        return self._exists(_SERVER_SEEN, message.guild.id)
 
     def channel_seen(self, message: discord.Message) -> bool:
         """Return True if the channel from this message is already in the database."""
-        with self._get_conn() as conn:
-            row = conn.execute(
-                "SELECT 1 FROM channels WHERE channel_id = ?",
-                (message.channel.id,)
-            ).fetchone()
-        return row is not None
+        return self._exists(_CHANNEL_SEEN, message.channel.id)
 
     def user_seen(self, message: discord.Message) -> bool:
         """Return True if the author of this message is already in the database."""
-        with self._get_conn() as conn:
-            row = conn.execute(
-                "SELECT 1 FROM users WHERE user_id = ?",
-                (message.author.id,)
-            ).fetchone()
-        return row is not None
+        return self._exists(_USER_SEEN, message.author.id)
 
     # ------------------------------------------------------------------
     # Insertion
@@ -148,11 +220,7 @@ class Registry:
     def add_server(self, message: discord.Message) -> None:
         """Record the guild from this message. No-op if already present."""
         with self._get_conn() as conn:
-            cursor = conn.execute(
-                "INSERT OR IGNORE INTO servers (server_id, server_name) VALUES (?, ?)",
-                (message.guild.id, message.guild.name)
-            )
-            conn.commit()
+            cursor = conn.execute(_INSERT_SERVER, (message.guild.id, message.guild.name))
         if cursor.rowcount:
             logger.info("New server seen: %s (%s)", message.guild.name, message.guild.id)
 
@@ -161,10 +229,9 @@ class Registry:
         self.add_server(message)
         with self._get_conn() as conn:
             cursor = conn.execute(
-                "INSERT OR IGNORE INTO channels (channel_id, channel_name, server_id) VALUES (?, ?, ?)",
-                (message.channel.id, message.channel.name, message.guild.id)
+                _INSERT_CHANNEL,
+                (message.channel.id, message.channel.name, message.guild.id),
             )
-            conn.commit()
         if cursor.rowcount:
             logger.info("New channel seen: #%s in %s", message.channel.name, message.guild.name)
 
@@ -174,28 +241,45 @@ class Registry:
         the nickname will be updated if it has changed."""
         self.add_server(message)  # user_nicknames foreign-keys into servers
         with self._get_conn() as conn:
-            cursor = conn.execute(
-                "INSERT OR IGNORE INTO users (user_id, user_name) VALUES (?, ?)",
-                (message.author.id, message.author.name)
-            )
+            cursor = conn.execute(_INSERT_USER, (message.author.id, message.author.name))
             if cursor.rowcount:
                 logger.info("New user seen: %s (%s)", message.author.name, message.author.id)
-            # INSERT OR REPLACE so nickname changes are picked up over time
-            conn.execute(
-                """
-                INSERT INTO user_nicknames (user_id, server_id, nickname)
-                VALUES (?, ?, ?)
-                ON CONFLICT(user_id, server_id) DO UPDATE SET nickname = excluded.nickname
-                """,
-                (message.author.id, message.guild.id, message.author.nick),
-            )
-            conn.commit()
+            conn.execute(_UPSERT_NICKNAME, (message.author.id, message.guild.id, message.author.nick))
+        self._forget_user_info(message.author.id, message.guild.id)
 
     def ensure_seen(self, message: discord.Message) -> None:
         """Record guild, channel, and author from a message if not already known.
-        Call this at the top of your on_message handler."""
-        self.add_channel(message)  # add_channel already handles the server
-        self.add_user(message)
+        Call this at the top of your on_message handler.
+
+        Everything is written in one transaction, and a (server, channel,
+        user) triple already recorded with the same nickname skips SQL
+        entirely, so regulars cost nothing after their first message.
+        """
+        key = (message.guild.id, message.channel.id, message.author.id)
+        nick = message.author.nick
+        if key in self._seen and self._seen[key] == nick:
+            return
+
+        with self._get_conn() as conn:
+            new_server = conn.execute(_INSERT_SERVER, (message.guild.id, message.guild.name)).rowcount
+            new_channel = conn.execute(
+                _INSERT_CHANNEL,
+                (message.channel.id, message.channel.name, message.guild.id),
+            ).rowcount
+            new_user = conn.execute(_INSERT_USER, (message.author.id, message.author.name)).rowcount
+            conn.execute(_UPSERT_NICKNAME, (message.author.id, message.guild.id, nick))
+        self._forget_user_info(message.author.id, message.guild.id)
+
+        if new_server:
+            logger.info("New server seen: %s (%s)", message.guild.name, message.guild.id)
+        if new_channel:
+            logger.info("New channel seen: #%s in %s", message.channel.name, message.guild.name)
+        if new_user:
+            logger.info("New user seen: %s (%s)", message.author.name, message.author.id)
+
+        if len(self._seen) >= _SEEN_CACHE_MAX:
+            self._seen.clear()
+        self._seen[key] = nick
 
     # ------------------------------------------------------------------
     # Lookup
@@ -207,7 +291,7 @@ class Registry:
 
         Returned dict keys: channel_id, channel_name, server_id, server_name
         """
-        with self._get_conn() as conn:
+        with self._read_conn() as conn:
             row = conn.execute(
                 """
                 SELECT c.channel_id, c.channel_name, s.server_id, s.server_name
@@ -230,7 +314,7 @@ class Registry:
         Returned dict keys (with server_id): user_id, user_name, nickname, server_id, server_name
         Returned dict keys (without server_id): user_id, user_name
         """
-        with self._get_conn() as conn:
+        with self._read_conn() as conn:
             if server_id is not None:
                 row = conn.execute(
                     """
@@ -249,6 +333,66 @@ class Registry:
                 ).fetchone()
         return dict(row) if row is not None else None
 
+    def get_user_infos(
+        self,
+        pairs: Iterable[tuple[int, int]],
+    ) -> dict[tuple[int, int], dict]:
+        """
+        Bulk form of get_user_info(user_id, server_id) for many authors at once.
+
+        Returns {(user_id, server_id): {user_id, user_name, nickname, server_id}}
+        for every pair whose user is known; unknown users are simply absent.
+        One query per _BULK_LOOKUP_CHUNK pairs instead of one per pair, and
+        answers are remembered for _USER_INFO_TTL_SECONDS (writes through
+        this Registry invalidate them) since the same regulars recur.
+        """
+        found: dict[tuple[int, int], dict] = {}
+        wanted: list[tuple[int, int]] = []
+        now = time.monotonic()
+        with self._user_info_lock:
+            for pair in dict.fromkeys(pairs):
+                cached = self._user_info_cache.get(pair)
+                if cached is not None and now < cached[0]:
+                    if cached[1] is not None:
+                        found[pair] = cached[1]
+                else:
+                    wanted.append(pair)
+        if not wanted:
+            return found
+        fetched: dict[tuple[int, int], dict] = {}
+        with self._read_conn() as conn:
+            for start in range(0, len(wanted), _BULK_LOOKUP_CHUNK):
+                chunk = wanted[start:start + _BULK_LOOKUP_CHUNK]
+                values = ", ".join("(?, ?)" for _ in chunk)
+                rows = conn.execute(
+                    f"""
+                    WITH wanted(user_id, server_id) AS (VALUES {values})
+                    SELECT u.user_id, u.user_name, un.nickname, w.server_id
+                    FROM wanted w
+                    JOIN users u ON u.user_id = w.user_id
+                    LEFT JOIN user_nicknames un
+                        ON un.user_id = w.user_id AND un.server_id = w.server_id
+                    """,
+                    [value for pair in chunk for value in pair],
+                ).fetchall()
+                for row in rows:
+                    fetched[(row["user_id"], row["server_id"])] = dict(row)
+        expires = now + _USER_INFO_TTL_SECONDS
+        with self._user_info_lock:
+            for pair in wanted:
+                # Unknown users are cached too; ensure_seen() invalidates the
+                # entry as soon as they're recorded.
+                self._user_info_cache[pair] = (expires, fetched.get(pair))
+                self._user_info_cache.move_to_end(pair)
+            while len(self._user_info_cache) > _USER_INFO_CACHE_MAX:
+                self._user_info_cache.popitem(last=False)
+        found.update(fetched)
+        return found
+
+    def _forget_user_info(self, user_id: int, server_id: int) -> None:
+        with self._user_info_lock:
+            self._user_info_cache.pop((user_id, server_id), None)
+
     def set_voice_admin(self, *, user_id: int, server_id: int, is_admin: bool) -> None:
         with self._get_conn() as conn:
             conn.execute(
@@ -267,10 +411,10 @@ class Registry:
                 """,
                 (user_id, server_id, 1 if is_admin else 0),
             )
-            conn.commit()
+        self._forget_user_info(user_id, server_id)
 
     def is_voice_admin(self, *, user_id: int, server_id: int) -> bool:
-        with self._get_conn() as conn:
+        with self._read_conn() as conn:
             row = conn.execute(
                 """
                 SELECT voice_admin
@@ -58,7 +58,8 @@ class RuntimeState:
         self._discord_servers: list[str] = []
         self._active_turns: dict[str, ActiveTurn] = {}
         self._memory_queue_depth = 0
-        self._memory_processing_message_id: int | None = None
+        # In start order; the burst worker handles several messages at once.
+        self._memory_processing_ids: list[int | None] = []
         self._last_bouncer_decision: BouncerDecisionSnapshot | None = None
         self._voice = VoiceSnapshot(
             active=False,
@@ -138,12 +139,12 @@ class RuntimeState:
         with self._lock:
             if self._memory_queue_depth > 0:
                 self._memory_queue_depth -= 1
-            self._memory_processing_message_id = message_id
+            self._memory_processing_ids.append(message_id)
 
     def memory_processing_finished(self, *, message_id: int | None) -> None:
         with self._lock:
-            if self._memory_processing_message_id == message_id:
-                self._memory_processing_message_id = None
+            if message_id in self._memory_processing_ids:
+                self._memory_processing_ids.remove(message_id)
 
     def set_last_bouncer_decision(
         self,
@@ -306,8 +307,9 @@ class RuntimeState:
                 "active_turns": active_turns,
                 "memory_worker": {
                     "queue_depth": self._memory_queue_depth,
-                    "processing_message_id": self._memory_processing_message_id,
-                    "busy": self._memory_processing_message_id is not None,
+                    "processing_message_id": self._memory_processing_ids[-1] if self._memory_processing_ids else None,
+                    "processing_count": len(self._memory_processing_ids),
+                    "busy": bool(self._memory_processing_ids),
                 },
                 "last_bouncer_decision": last_bouncer,
             }
@@ -5,8 +5,8 @@ This module is the single place where tools are defined and dispatched.
 Adding a new tool:
     1. Write an async handler function (_handle_<name>).
     2. Add its schema dict to TOOL_SCHEMAS.
-    3. Register the name in _HANDLERS.
-    4. If it queries per-server data, add the name to _SERVER_SCOPED_TOOLS.
+    3. Register it in _DISPATCH as (handler, server_scoped), with
+       server_scoped=True if it queries per-server data.
 
 Server isolation for Recall tools
 ----------------------------------
@@ -17,9 +17,12 @@ handler, regardless of what the model provided.
 """
 
 import asyncio
+import functools
+import logging
 import os
 import random
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -94,15 +97,60 @@ _steam_cache_lock = asyncio.Lock()
 
 _PACIFIC = ZoneInfo("America/Los_Angeles")
 
+# One pooled HTTP client for SearXNG and the Steam store, so repeated tool
+# calls reuse keep-alive connections instead of a fresh TCP/TLS handshake
+# each.  Created lazily on first use; closed by close_http_client().  Pooled
+# connections belong to the loop that opened them, so a client is only reused
+# on the loop it was created on.
+_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=10,
+    max_connections=20,
+    keepalive_expiry=30.0,
+)
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
 # Registry for resolving current nicknames from stored author_id + server_id.
 # Initialised by init_tools_config() at pipeline construction time.
 _registry: Registry | None = None
 
 
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client_loop is not loop:
+        # A client left over from a finished loop can't be closed from this
+        # one; drop it and let its sockets be collected.
+        _http_client = httpx.AsyncClient(
+            timeout=15.0,
+            headers={"Accept": "application/json"},
+            limits=_HTTP_LIMITS,
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client. Called from pipeline shutdown."""
+    global _http_client, _http_client_loop
+    client, _http_client, _http_client_loop = _http_client, None, None
+    if client is not None:
+        await client.aclose()
+
+
 # ---------------------------------------------------------------------------
 # Internal Recall query helper
 # ---------------------------------------------------------------------------
 
+# Identical Recall queries within a short window (the same question asked
+# twice in a busy channel, or a retried turn) are answered from memory rather
+# than another SQLite round trip.  Kept short so newly archived messages show
+# up quickly.
+_RECALL_CACHE_TTL_SECONDS = 60.0
+_RECALL_CACHE_MAX = 256
+_recall_cache: OrderedDict[tuple, tuple[float, list]] = OrderedDict()
+
+
 async def _recall_query(**kwargs: Any) -> list | None:
     """Query Recall via direct DB call. Returns list of ChatMessageResponse or None on error.
 
@@ -121,54 +169,122 @@ async def _recall_query(**kwargs: Any) -> list | None:
     if "query" in clean:
         clean["q"] = clean.pop("query")
     try:
-        return await asyncio.to_thread(_recall_db.get_messages, **clean)
+        key: tuple | None = tuple(sorted(clean.items()))
+        hash(key)
+    except TypeError:  # list-valued params from the model; just don't cache
+        key = None
+    now = time.monotonic()
+    if key is not None:
+        cached = _recall_cache.get(key)
+        if cached is not None and now < cached[0]:
+            _recall_cache.move_to_end(key)
+            return cached[1]
+    try:
+        data = await asyncio.to_thread(_recall_db.get_messages, **clean)
     except Exception as exc:
         logger.error("Recall query error: %s", exc)
         return None
+    if key is not None:
+        _recall_cache[key] = (now + _RECALL_CACHE_TTL_SECONDS, data)
+        _recall_cache.move_to_end(key)
+        if len(_recall_cache) > _RECALL_CACHE_MAX:
+            _recall_cache.popitem(last=False)
+    return data
+
+
+# Recall lines show timestamps to the minute, and a result page tends to
+# cluster in a few minutes, so the zoneinfo conversion + strftime runs once
+# per distinct minute.  (UTC offsets are whole minutes, so epoch minutes line
+# up with local minutes.)
+@functools.lru_cache(maxsize=4096)
+def _pacific_minute(epoch_minute: int) -> str:
+    return datetime.fromtimestamp(epoch_minute * 60, _PACIFIC).strftime("%Y-%m-%d %H:%M %Z")
+
+
+def _format_ts(dt: datetime) -> str:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return _pacific_minute(int(dt.timestamp() // 60))
+
 
+_NO_MESSAGES = "(no messages found)"
 
-def _format_messages(data: list) -> str:
+# Recall results larger than this are formatted in a worker thread.
+_THREAD_FORMAT_MIN_ROWS = 32
+
+
+def _author_pairs(data: list) -> list[tuple[int, int]]:
+    return [(msg.author_id, msg.server_id) for msg in data if msg.author_id and msg.server_id]
+
+
+async def _lookup_authors(data: list) -> dict[tuple[int, int], dict]:
+    """Resolve every author in a Recall result with one registry query.
+
+    Runs in a worker thread so the event loop isn't blocked on SQLite while
+    other tool calls or Discord events are in flight.
+    """
+    if _registry is None:
+        return {}
+    return await asyncio.to_thread(_registry.get_user_infos, _author_pairs(data))
+
+
+async def _render_recall(data: list) -> str:
+    """Resolve authors, then format; big results are formatted off the event loop.
+
+    The registry lookup finishes before the thread hop, so the worker only
+    formats.
+    """
+    user_infos = await _lookup_authors(data)
+    if len(data) > _THREAD_FORMAT_MIN_ROWS:
+        return await asyncio.to_thread(_format_messages, data, user_infos)
+    return _format_messages(data, user_infos)
+
+
+def _format_messages(
+    data: list,
+    user_infos: dict[tuple[int, int], dict] | None = None,
+) -> str:
     """Format a list of ChatMessageResponse objects into a readable block for the model.
 
     Author display names are resolved via the registry so Sandy sees current
     nicknames rather than whatever name was stored at the time the message was
     archived. Falls back to the stored author_name if the user isn't in the
     registry (e.g. a message from before the bot joined).
+
+    Tool handlers pass user_infos from _lookup_authors(); without it the
+    registry is queried inline.
     """
+    if not data:
+        return _NO_MESSAGES
+    if user_infos is None:
+        # One registry query for every author in the batch instead of one per row.
+        user_infos = _registry.get_user_infos(_author_pairs(data)) if _registry is not None else {}
+
     lines = []
+    find_user = user_infos.get
     for msg in data:
         try:
-            dt = msg.timestamp
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            ts = dt.astimezone(_PACIFIC).strftime("%Y-%m-%d %H:%M %Z")
+            ts = _format_ts(msg.timestamp)
         except Exception:
             ts = "?"
 
         # Prefer current nickname from registry; fall back to archived name.
-        author_id   = msg.author_id
-        server_id   = msg.server_id
         stored_name = msg.author_name or "?"
-        if author_id and server_id and _registry is not None:
-            info = _registry.get_user_info(author_id, server_id)
-            if info:
-                author = info.get("nickname") or info.get("user_name") or stored_name
-            else:
-                author = stored_name
+        info = find_user((msg.author_id, msg.server_id))
+        if info:
+            author = info.get("nickname") or info.get("user_name") or stored_name
         else:
             author = stored_name
 
-        channel = msg.channel_name or "?"
-        content = msg.content or ""
-        tags    = msg.tags or []
-        summary = msg.summary or ""
-        line    = f"[{ts}] #{channel} <{author}>: {content}"
+        tags = msg.tags
+        summary = msg.summary
+        parts = [f"[{ts}] #{msg.channel_name or '?'} <{author}>: {msg.content or ''}"]
         if tags:
-            line += f"  [tags: {', '.join(tags)}]"
+            parts.append(f"  [tags: {', '.join(tags)}]")
         if summary:
-            line += f"  (summary: {summary})"
-        lines.append(line)
-    return "\n".join(lines) if lines else "(no messages found)"
+            parts.append(f"  (summary: {summary})")
+        lines.append("".join(parts))
+    return "\n".join(lines)
 
 
 # ---------------------------------------------------------------------------
@@ -197,7 +313,8 @@ async def _handle_recall_recent(args: dict[str, Any]) -> str:
         return "Error: could not reach the memory store."
     if not data:
         return "No messages found matching those filters."
-    return f"{len(data)} message(s) retrieved:\n\n{_format_messages(data)}"
+    formatted = await _render_recall(data)
+    return f"{len(data)} message(s) retrieved:\n\n{formatted}"
 
 
 async def _handle_recall_from_user(args: dict[str, Any]) -> str:
@@ -207,7 +324,8 @@ async def _handle_recall_from_user(args: dict[str, Any]) -> str:
         return "Error: could not reach the memory store."
     if not data:
         return f"No messages found from author: {args.get('author', '?')}"
-    return f"{len(data)} message(s) retrieved:\n\n{_format_messages(data)}"
+    formatted = await _render_recall(data)
+    return f"{len(data)} message(s) retrieved:\n\n{formatted}"
 
 
 async def _handle_recall_by_topic(args: dict[str, Any]) -> str:
@@ -217,7 +335,8 @@ async def _handle_recall_by_topic(args: dict[str, Any]) -> str:
         return "Error: could not reach the memory store."
     if not data:
         return f"No messages found for topic: {args.get('tag', '?')}"
-    return f"{len(data)} message(s) retrieved:\n\n{_format_messages(data)}"
+    formatted = await _render_recall(data)
+    return f"{len(data)} message(s) retrieved:\n\n{formatted}"
 
 
 async def _handle_search_memories(args: dict[str, Any]) -> str:
@@ -227,23 +346,38 @@ async def _handle_search_memories(args: dict[str, Any]) -> str:
         return "Error: could not reach the memory store."
     if not data:
         return f"No messages found for query: {args.get('query', '?')}"
-    return f"{len(data)} message(s) found:\n\n{_format_messages(data)}"
+    formatted = await _render_recall(data)
+    return f"{len(data)} message(s) found:\n\n{formatted}"
 
 
-async def _handle_get_current_time(_args: dict[str, Any]) -> str:
-    """Return the current date and time in Pacific time."""
-    now = datetime.now(_PACIFIC)
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+
+def _describe_time(now: datetime) -> str:
+    # Plain attribute reads instead of three strftime calls (which would also
+    # follow the process locale; Sandy speaks English regardless).
     day = now.day
     suffix = (
         "th" if 11 <= day <= 13
         else {1: "st", 2: "nd", 3: "rd"}.get(day % 10, "th")
     )
+    hour = now.hour % 12 or 12
+    meridiem = "AM" if now.hour < 12 else "PM"
     return (
-        f"Today is {now.strftime('%A, %B')} {day}{suffix}, {now.year}. "
-        f"The current time is {now.strftime('%I:%M %p')} {now.strftime('%Z')}."
+        f"Today is {_WEEKDAYS[now.weekday()]}, {_MONTHS[now.month - 1]} {day}{suffix}, {now.year}. "
+        f"The current time is {hour:02d}:{now.minute:02d} {meridiem} {now.tzname()}."
     )
 
 
+async def _handle_get_current_time(_args: dict[str, Any]) -> str:
+    """Return the current date and time in Pacific time."""
+    return _describe_time(datetime.now(_PACIFIC))
+
+
 async def _handle_search_web(args: dict[str, Any]) -> str:
     """Search the web via SearXNG and return a formatted snippet block."""
     query = args.get("query", "").strip()
@@ -257,14 +391,9 @@ async def _handle_search_web(args: dict[str, Any]) -> str:
         "language": "en",
     }
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            r = await client.get(
-                f"{_SEARXNG_BASE}/search",
-                params=params,
-                headers={"Accept": "application/json"},
-            )
-            r.raise_for_status()
-            data = r.json()
+        r = await _get_http_client().get(f"{_SEARXNG_BASE}/search", params=params)
+        r.raise_for_status()
+        data = r.json()
     except Exception as exc:
         logger.error("SearXNG error (query=%r): %s", query, exc)
         return f"Error reaching web search: {exc}"
@@ -300,14 +429,12 @@ async def _get_steam_featured_categories() -> dict[str, Any]:
         if _steam_featured_cache is not None and now < _steam_featured_cache_expires_at:
             return _steam_featured_cache
 
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.get(
-                _STEAM_FEATURED_URL,
-                params={"cc": "us", "l": "en"},
-                headers={"Accept": "application/json"},
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await _get_http_client().get(
+            _STEAM_FEATURED_URL,
+            params={"cc": "us", "l": "en"},
+        )
+        response.raise_for_status()
+        data = response.json()
 
         _steam_featured_cache = data
         _steam_featured_cache_expires_at = time.monotonic() + max(0, _STEAM_CACHE_TTL_SECONDS)
@@ -580,37 +707,52 @@ TOOL_SCHEMAS: list[dict] = [
     },
 ]
 
-# Map tool name → handler function.
-_HANDLERS: dict[str, Any] = {
-    "recall_recent":    _handle_recall_recent,
-    "recall_from_user": _handle_recall_from_user,
-    "recall_by_topic":  _handle_recall_by_topic,
-    "search_memories":  _handle_search_memories,
-    "get_current_time": _handle_get_current_time,
-    "search_web":       _handle_search_web,
-    "steam_browse":     _handle_steam_browse,
-    "dice_roll":        _handle_dice_roll,
+# Map tool name → (handler function, server-scoped?).  Server-scoped tools
+# query per-server data and get server_id injected by dispatch(); a tool like
+# 'search_web' is not scoped.
+_DISPATCH: dict[str, tuple[Any, bool]] = {
+    "recall_recent":    (_handle_recall_recent,    True),
+    "recall_from_user": (_handle_recall_from_user, True),
+    "recall_by_topic":  (_handle_recall_by_topic,  True),
+    "search_memories":  (_handle_search_memories,  True),
+    "get_current_time": (_handle_get_current_time, False),
+    "search_web":       (_handle_search_web,       False),
+    "steam_browse":     (_handle_steam_browse,     False),
+    "dice_roll":        (_handle_dice_roll,        False),
 }
 
-# Tools that query per-server data and require server_id injection.
-# A future tool like 'search_web' would NOT appear here.
-_SERVER_SCOPED_TOOLS: frozenset[str] = frozenset({
-    "recall_recent",
-    "recall_from_user",
-    "recall_by_topic",
-    "search_memories",
-})
+# Snowflake IDs dropped from server-scoped tool arguments (see _scoped_arguments).
+_STRIP_KEYS: frozenset[str] = frozenset({"channel_id", "author_id"})
 
 # Public set of valid tool names — used by discord_handler to guard against
-# the bouncer hallucinating a non-existent tool name.  Derived from _HANDLERS
+# the bouncer hallucinating a non-existent tool name.  Derived from _DISPATCH
 # so it stays in sync automatically whenever a new tool is registered.
-KNOWN_TOOLS: frozenset[str] = frozenset(_HANDLERS)
+KNOWN_TOOLS: frozenset[str] = frozenset(_DISPATCH)
 
 
 # ---------------------------------------------------------------------------
 # Dispatcher — called by discord_handler after bouncer selects a tool
 # ---------------------------------------------------------------------------
 
+def _scoped_arguments(arguments: dict[str, Any], server_id: int) -> dict[str, Any]:
+    # Enforce server isolation: stamp server_id onto all memory tools.
+    # Also strip channel_id — Sandy has no reliable way to know channel snowflakes;
+    # she should search server-wide and filter by channel *name* only if the user
+    # explicitly named one. Leaving channel_id in causes silent empty results when
+    # the model hallucinates or copies a stale ID from prior context.
+    #
+    # Strip any integer snowflake IDs the model may have hallucinated —
+    # channel_id and author_id are never shown to the model so it can only
+    # guess them, and wrong IDs silently return zero results.
+    # Name-based filters (author, channel) are safe: names appear in context.
+    # One C-level copy, then drop/stamp in place (the caller's dict is untouched).
+    scoped = dict(arguments)
+    for key in _STRIP_KEYS:
+        scoped.pop(key, None)
+    scoped["server_id"] = server_id
+    return scoped
+
+
 async def dispatch(
     tool_name: str,
     arguments: dict[str, Any],
@@ -622,34 +764,43 @@ async def dispatch(
     For server-scoped tools, server_id and server_name are forcibly
     overwritten — the model cannot request data from a different server.
     """
-    handler = _HANDLERS.get(tool_name)
-    if handler is None:
+    entry = _DISPATCH.get(tool_name)
+    if entry is None:
         logger.warning("Brain requested unknown tool: %r", tool_name)
         return f"Error: unknown tool '{tool_name}'."
-
-    # Enforce server isolation: stamp server_id onto all memory tools.
-    # Also strip channel_id — Sandy has no reliable way to know channel snowflakes;
-    # she should search server-wide and filter by channel *name* only if the user
-    # explicitly named one. Leaving channel_id in causes silent empty results when
-    # the model hallucinates or copies a stale ID from prior context.
-    if tool_name in _SERVER_SCOPED_TOOLS:
-        # Strip any integer snowflake IDs the model may have hallucinated —
-        # channel_id and author_id are never shown to the model so it can only
-        # guess them, and wrong IDs silently return zero results.
-        # Name-based filters (author, channel) are safe: names appear in context.
-        arguments = {k: v for k, v in arguments.items() if k not in ("channel_id", "author_id")}
-        arguments = {**arguments, "server_id": server_id}
+    handler, scoped = entry
+    if scoped:
+        arguments = _scoped_arguments(arguments, server_id)
 
     # Log without server context to keep logs tidy (it's always the same value).
-    loggable = {k: v for k, v in arguments.items() if k not in ("server_id",)}
-    logger.info("Using tool %s args=%s", tool_name, loggable)
+    # The filtered copy is only built when INFO logging is actually on.
+    log_info = logger.isEnabledFor(logging.INFO)
+    if log_info:
+        loggable = {k: v for k, v in arguments.items() if k != "server_id"}
+        logger.info("Using tool %s args=%s", tool_name, loggable)
 
     try:
         result = await handler(arguments)
-        # Log a useful preview of what came back.
-        preview = result[:200] if result else "(empty)"
-        logger.info("Tool %s returned (%d chars): %s", tool_name, len(result or ""), preview)
+        if log_info:
+            # Log a useful preview of what came back.
+            preview = result[:200] if result else "(empty)"
+            logger.info("Tool %s returned (%d chars): %s", tool_name, len(result or ""), preview)
         return result
     except Exception as exc:
         logger.error("Tool %r raised: %s", tool_name, exc)
         return f"Error executing {tool_name}: {exc}"
+
+
+async def dispatch_many(
+    calls: list[tuple[str, dict[str, Any]]],
+    server_id: int,
+    server_name: str,
+) -> list[str]:
+    """Run several independent tool calls concurrently; results keep input order.
+
+    Each call goes through dispatch(), so server isolation applies and a
+    failing tool yields its error string without cancelling the others.
+    """
+    return await asyncio.gather(
+        *(dispatch(name, args, server_id, server_name) for name, args in calls)
+    )
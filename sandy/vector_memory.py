@@ -26,11 +26,17 @@ be pulled in ollama before the bot starts.  Embeddings are generated via the
 async ollama Python client.
 """
 
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
 import chromadb
+import httpx
 import ollama
 
 from .logconf import get_logger
@@ -42,6 +48,51 @@ _PACIFIC      = ZoneInfo("America/Los_Angeles")
 _COLLECTION   = "sandy_messages"
 
 
+# Every incoming message is embedded, so keep idle connections to ollama
+# around rather than reconnecting per request.  (The host still comes from
+# OLLAMA_HOST, which the ollama client reads itself.)
+_EMBED_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+
+# query() answers are reused for this long; the same phrasing inside the
+# window gets the same background memories anyway.
+_RESULT_TTL_SECONDS = 30.0
+_RESULT_CACHE_MAX = 512
+
+# add_message() calls are gathered for this long, or until this many are
+# waiting, then embedded and upserted together.
+_BATCH_WINDOW_SECONDS = 0.05
+_BATCH_MAX = 32
+
+
+@dataclass(frozen=True, slots=True)
+class VectorRecord:
+    """One message for VectorMemory.add_messages()."""
+    message_id: str
+    content: str
+    author_name: str
+    server_id: int
+    timestamp: datetime
+
+
+# Stored timestamps are ISO strings; the same ones come back query after
+# query, so parse + convert + strftime once per distinct value.
+@functools.lru_cache(maxsize=4096)
+def _format_ts(ts_raw: str) -> str:
+    try:
+        dt = datetime.fromisoformat(ts_raw)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(_PACIFIC).strftime("%Y-%m-%d %H:%M %Z")
+    except Exception:
+        return ts_raw or "?"
+
+
+def _storable(content: str) -> bool:
+    # Empty text and the Recall server's attachment placeholder aren't worth
+    # embedding.
+    return bool(content and content.strip()) and content.strip() != "(no text content)"
+
+
 class VectorMemory:
     """
     Persistent semantic memory backed by ChromaDB + ollama embeddings.
@@ -96,10 +147,20 @@ class VectorMemory:
         )
         self._embed_model = embed_model
         self._max_distance = max_distance
-        self._embed_client = ollama.AsyncClient()
+        self._embed_client = ollama.AsyncClient(limits=_EMBED_HTTP_LIMITS, timeout=60.0)
+        # Running document count, used by query() to cap n_results without a
+        # COUNT per query.  add_messages() only counts ids the collection
+        # didn't already have, so re-upserts don't inflate it; query() still
+        # re-counts for real while it is at or below n_results.
+        self._doc_count = self._collection.count()
+        self._pending: list[tuple[VectorRecord, asyncio.Future]] = []
+        self._inflight: dict[tuple[str, int, int], asyncio.Future] = {}
+        self._results: OrderedDict[tuple[str, int, int], tuple[float, str]] = OrderedDict()
+        self._flush_task: asyncio.Task | None = None
+        self._writes: set[asyncio.Task[None]] = set()
         logger.info(
             "VectorMemory ready (path=%r, collection=%r, docs=%d)",
-            str(chroma_path), _COLLECTION, self._collection.count(),
+            str(chroma_path), _COLLECTION, self._doc_count,
         )
 
     # ------------------------------------------------------------------
@@ -121,30 +182,110 @@ class VectorMemory:
         author_name — display name at time of storage
         server_id   — Discord guild ID; stored in metadata for isolation filtering
         timestamp   — message creation time (tz-aware UTC preferred)
+
+        Calls arriving within _BATCH_WINDOW_SECONDS of each other are written
+        together through add_messages() (one embed request, one upsert); each
+        caller still gets its own result, or the batch's exception.
         """
-        if not content or not content.strip():
-            return False
-        # Skip pure placeholder text stored by the Recall server for attachments.
-        if content.strip() == "(no text content)":
+        record = VectorRecord(message_id, content, author_name, server_id, timestamp)
+        if not _storable(record.content):
             return False
-        resp = await self._embed_client.embed(model=self._embed_model, input=content)
-        embedding = resp.embeddings[0]
-        ts_str = timestamp.isoformat() if timestamp else ""
-        self._collection.upsert(
-            ids=[message_id],
-            embeddings=[embedding],
-            documents=[content],
-            metadatas=[{
-                "author_name": author_name,
-                "server_id":   server_id,
-                "timestamp":   ts_str,
-            }],
-        )
-        logger.debug(
-            "VectorMemory.add_message stored id=%s server=%d author=%r",
-            message_id, server_id, author_name,
-        )
-        return True
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((record, future))
+        if len(self._pending) >= _BATCH_MAX:
+            self._start_write()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+        # The write runs in its own task, so cancelling this caller can't
+        # strand the rest of its batch.
+        return await asyncio.shield(future)
+
+    async def add_messages(self, records: list[VectorRecord]) -> list[bool]:
+        """Embed and upsert several messages with one embed call and one upsert.
+
+        Returns one flag per record, False where the content was skipped.
+        """
+        flags = [_storable(record.content) for record in records]
+        kept = [record for record, ok in zip(records, flags) if ok]
+        if kept:
+            resp = await self._embed_client.embed(
+                model=self._embed_model,
+                input=[record.content for record in kept],
+            )
+            ids = [record.message_id for record in kept]
+
+            def _store() -> int:
+                # Re-upserting an id (an edit, a replayed message) replaces
+                # it, so only brand-new ids add to the running count.
+                existing = self._collection.get(ids=ids, include=[])
+                self._collection.upsert(
+                    ids=ids,
+                    embeddings=list(resp.embeddings),
+                    documents=[record.content for record in kept],
+                    metadatas=[{
+                        "author_name": record.author_name,
+                        "server_id":   record.server_id,
+                        "timestamp":   record.timestamp.isoformat() if record.timestamp else "",
+                    } for record in kept],
+                )
+                return len(set(ids).difference(existing.get("ids") or ()))
+
+            self._doc_count += await asyncio.to_thread(_store)
+            logger.debug(
+                "VectorMemory.add_messages stored %d message(s): %s",
+                len(kept), ", ".join(record.message_id for record in kept),
+            )
+        return flags
+
+    async def aclose(self) -> None:
+        """Write any batched messages still waiting, then close the embed client."""
+        self._start_write()
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+        await self._embed_client.close()
+
+    async def _flush_after_window(self) -> None:
+        try:
+            await asyncio.sleep(_BATCH_WINDOW_SECONDS)
+        except asyncio.CancelledError:
+            self._flush_task = None
+            batch, self._pending = self._pending, []
+            for _, future in batch:
+                future.cancel()
+            raise
+        self._flush_task = None
+        self._start_write()
+
+    def _start_write(self) -> None:
+        """Hand everything pending to a background write task."""
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._write_batch(batch))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def _write_batch(self, batch: list[tuple[VectorRecord, asyncio.Future]]) -> None:
+        try:
+            stored = await self.add_messages([record for record, _ in batch])
+        except BaseException as exc:
+            # Every caller gets an answer, even if this task is cancelled.
+            for _, future in batch:
+                if future.done():
+                    continue
+                if isinstance(exc, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(exc)
+            if not isinstance(exc, Exception):
+                raise
+            return
+        for (_, future), ok in zip(batch, stored):
+            if not future.done():
+                future.set_result(ok)
 
     # ------------------------------------------------------------------
     # Read
@@ -164,19 +305,62 @@ class VectorMemory:
 
         Returns a newline-joined block ready for injection into a system
         prompt, or an empty string if nothing relevant is found or on error.
+
+        Concurrent identical queries share one embed + search, and answers
+        are reused for _RESULT_TTL_SECONDS.
         """
         if not text or not text.strip():
             return ""
+        key = (text, server_id, n_results)
+        now = time.monotonic()
+        cached = self._results.get(key)
+        if cached is not None and now < cached[0]:
+            self._results.move_to_end(key)
+            return cached[1]
+        # Someone is already running this exact query: share their answer.
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        block: str | None = None
+        try:
+            block = await self._search(text, server_id, n_results)
+        finally:
+            del self._inflight[key]
+            future.set_result(block or "")
+        if block is not None:
+            self._results[key] = (now + _RESULT_TTL_SECONDS, block)
+            self._results.move_to_end(key)
+            if len(self._results) > _RESULT_CACHE_MAX:
+                self._results.popitem(last=False)
+        return block or ""
+
+    async def _search(self, text: str, server_id: int, n_results: int) -> str | None:
+        """Embed, search and format one query; None on error (not cached)."""
         try:
-            total = self._collection.count()
+            embed = self._embed_client.embed(model=self._embed_model, input=text)
+            if self._doc_count > n_results:
+                total, resp = self._doc_count, await embed
+            else:
+                # Small (or empty) collection: the cap matters, so count for
+                # real.  It's independent of the embedding, so run them
+                # together and let the count hide inside the embed round trip.
+                total, resp = await asyncio.gather(
+                    asyncio.to_thread(self._collection.count),
+                    embed,
+                )
+                self._doc_count = total
             if total == 0:
                 return ""
             # Cap n_results at total doc count to avoid ChromaDB errors when
             # the collection is smaller than the requested result count.
             n = min(n_results, total)
-            resp = await self._embed_client.embed(model=self._embed_model, input=text)
             embedding = resp.embeddings[0]
-            results = self._collection.query(
+            # HNSW search is synchronous; keep it off the event loop.
+            results = await asyncio.to_thread(
+                self._collection.query,
                 query_embeddings=[embedding],
                 n_results=n,
                 where={"server_id": server_id},
@@ -187,18 +371,13 @@ class VectorMemory:
             distances = results.get("distances",  [[]])[0]
 
             lines = []
+            # Chroma has no distance cutoff of its own, but hits come back
+            # nearest first, so everything after the first miss is a miss too.
             for doc, meta, dist in zip(docs, metas, distances):
                 if dist > self._max_distance:
-                    continue
+                    break
                 author = meta.get("author_name", "?")
-                ts_raw = meta.get("timestamp", "")
-                try:
-                    dt = datetime.fromisoformat(ts_raw)
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=timezone.utc)
-                    ts = dt.astimezone(_PACIFIC).strftime("%Y-%m-%d %H:%M %Z")
-                except Exception:
-                    ts = ts_raw or "?"
+                ts = _format_ts(meta.get("timestamp", ""))
                 lines.append(f"[{ts}] <{author}>: {doc}")
 
             if lines:
@@ -211,7 +390,7 @@ class VectorMemory:
             return "\n".join(lines)
         except Exception as exc:
             logger.error("VectorMemory.query failed: %s", exc)
-            return ""
+            return None
 
     def delete_message(self, message_id: str) -> bool:
         """Delete one vector-memory document by its Discord message snowflake."""
@@ -220,6 +399,7 @@ class VectorMemory:
             if not existing.get("ids"):
                 return False
             self._collection.delete(ids=[message_id])
+            self._doc_count = max(0, self._doc_count - 1)
             logger.info("VectorMemory.delete_message removed id=%s", message_id)
             return True
         except Exception as exc:
@@ -85,6 +85,17 @@ def _truncate_sentences(text: str, max_sentences: int) -> str:
     return " ".join(parts[:max_sentences]).strip()
 
 
+def _voice_reply_is_complete(text: str) -> bool:
+    """True once a streaming brain reply holds everything _sanitize_voice_reply() keeps.
+
+    A started word past the word cap, or a started sentence past the sentence
+    cap, means later tokens can only be trimmed away again.
+    """
+    if len(text.split()) > _VOICE_REPLY_MAX_WORDS:
+        return True
+    return len(re.split(r"(?<=[.!?])\s+", text.strip())) > _VOICE_REPLY_MAX_SENTENCES
+
+
 def _sanitize_voice_reply(text: str) -> str:
     cleaned = " ".join(text.strip().split())
     if not cleaned:
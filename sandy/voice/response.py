@@ -16,6 +16,7 @@ from .models import (
     _VOICE_REPLY_MAX_WORDS,
     _sanitize_voice_reply,
     _truncate_words,
+    _voice_reply_is_complete,
 )
 from .tracing import build_voice_trace, forensic_event, trace_event
 from .tts import wav_bytes_to_audio_source
@@ -136,6 +137,7 @@ async def respond_to_session(manager: VoiceManager, session_id: str) -> None:
                 mode="voice",
                 participant_names=session.participant_names,
                 trace=trace,
+                stop_when=_voice_reply_is_complete,
             )
         except Exception:
             trace_event(trace, "brain_completed", status="error")
@@ -159,6 +161,7 @@ async def respond_to_session(manager: VoiceManager, session_id: str) -> None:
             "brain_completed",
             duration_ms=int((perf_counter() - brain_started) * 1000),
             done_reason=brain.done_reason if brain is not None else None,
+            first_token_ms=getattr(brain, "first_token_ms", None),
             reply_chars=len((brain.content if brain is not None else "") or ""),
         )
         logger.info(
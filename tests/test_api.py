@@ -203,6 +203,13 @@ def test_api_service_serves_recent_and_trace_detail(monkeypatch, tmp_path: Path)
     missing = service.trace_detail_payload("missing")
     assert missing is None
 
+    registry = service._registry
+    assert registry is not None
+    service.trace_detail_payload("123")
+    assert service._registry is registry
+    service.close()
+    assert service._registry is None
+
 
 def test_resolve_static_path_stays_within_root(tmp_path: Path) -> None:
     root = tmp_path / "dashboard"
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+from datetime import UTC, datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 
 from sandy.bot import BackgroundTaskSupervisor
+from sandy.memory import MemoryClient
 from sandy.pipeline import MemoryWorker
+from sandy.recall import ChatDatabase
+from sandy.runtime_state import RuntimeState
 
 
 @pytest.mark.asyncio
@@ -80,3 +88,116 @@ async def test_memory_worker_logs_handler_error_and_keeps_draining_queue():
     await run_task
 
     assert calls == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_memory_worker_archives_overflow_without_enrichment(tmp_path: Path):
+    db = ChatDatabase(str(tmp_path / "recall.db"))
+    db.init_db()
+    llm = SimpleNamespace(ask_tagger=AsyncMock(return_value=["tag"]), ask_summarizer=AsyncMock())
+    memory = MemoryClient(db=db, llm=llm)
+    worker = MemoryWorker(
+        memory.process_and_store,
+        overflow_handler=functools.partial(memory.process_and_store, enrich=False),
+        maxsize=1,
+    )
+
+    def message(message_id: int):
+        return SimpleNamespace(
+            id=message_id,
+            content=f"message {message_id}",
+            created_at=datetime.now(UTC),
+            author=SimpleNamespace(id=1, display_name="alice"),
+            channel=SimpleNamespace(id=2, name="general"),
+            guild=SimpleNamespace(id=3, name="Test Guild"),
+        )
+
+    await worker.enqueue(message(1))
+    await worker.enqueue(message(2))
+    assert worker.overflowed == 1
+
+    run_task = asyncio.create_task(worker.run())
+    await worker.shutdown()
+    await run_task
+
+    queued = db.get_message_by_discord_id(1)
+    overflowed = db.get_message_by_discord_id(2)
+    assert queued is not None and queued.tags == ["tag"]
+    assert overflowed is not None and overflowed.content == "message 2"
+    assert not overflowed.tags
+    llm.ask_tagger.assert_awaited_once_with("message 1")
+
+
+@pytest.mark.asyncio
+async def test_memory_worker_without_overflow_handler_drops_when_full():
+    calls: list[int] = []
+
+    async def handler(message, image_descriptions=None):
+        calls.append(message.id)
+
+    worker = MemoryWorker(handler, maxsize=1)
+
+    await worker.enqueue(type("Message", (), {"id": 1})())
+    await worker.enqueue(type("Message", (), {"id": 2})())
+    assert worker.overflowed == 1
+
+    run_task = asyncio.create_task(worker.run())
+    await worker.shutdown()
+    await run_task
+
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_memory_worker_burst_handles_queued_messages_concurrently():
+    in_flight = 0
+    peak = 0
+    calls: list[int] = []
+
+    async def handler(message, image_descriptions=None):
+        nonlocal in_flight, peak
+        calls.append(message.id)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+    worker = MemoryWorker(handler, burst=3)
+    for message_id in (1, 2, 3):
+        await worker.enqueue(type("Message", (), {"id": message_id})())
+
+    run_task = asyncio.create_task(worker.run())
+    await worker.shutdown()
+    await run_task
+
+    assert calls == [1, 2, 3]
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_memory_worker_burst_reports_busy_until_every_message_finishes():
+    state = RuntimeState()
+    release = {1: asyncio.Event(), 2: asyncio.Event()}
+
+    async def handler(message, image_descriptions=None):
+        await release[message.id].wait()
+
+    worker = MemoryWorker(handler, runtime_state=state, burst=2)
+    for message_id in (1, 2):
+        await worker.enqueue(type("Message", (), {"id": message_id})())
+
+    run_task = asyncio.create_task(worker.run())
+    await asyncio.sleep(0.01)
+    assert state.snapshot()["memory_worker"]["processing_count"] == 2
+
+    # The later message finishing first must not mark the worker idle.
+    release[2].set()
+    await asyncio.sleep(0.01)
+    memory = state.snapshot()["memory_worker"]
+    assert memory["busy"] is True
+    assert memory["processing_message_id"] == 1
+
+    release[1].set()
+    await worker.shutdown()
+    await run_task
+    assert state.snapshot()["memory_worker"]["busy"] is False
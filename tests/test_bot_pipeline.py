@@ -10,6 +10,11 @@ import pytest
 
 from sandy.llm import BrainResponse
 from sandy.pipeline import AttachmentProcessingResult
+from sandy.pipeline.attachments import (
+    AttachmentPreparationResult,
+    PreparedAttachment,
+    describe_prepared_attachments,
+)
 
 
 @dataclass
@@ -612,3 +617,102 @@ async def test_steam_tool_skips_rag_query(bot_module, monkeypatch):
     vector_memory.query.assert_not_awaited()
     assert llm.ask_brain.await_args.kwargs["rag_context"] == ""
     assert "Steam Top Sellers" in llm.ask_brain.await_args.kwargs["tool_context"]
+
+
+@pytest.mark.asyncio
+async def test_tool_dispatch_and_retrieval_run_concurrently(bot_module, monkeypatch):
+    message = make_message(content="sandy what did we say about tarkov?")
+    cache = FakeCache()
+    memory_worker = FakeMemoryWorker()
+    llm = SimpleNamespace(
+        ask_bouncer=AsyncMock(
+            return_value=SimpleNamespace(
+                should_respond=True,
+                use_tool=True,
+                recommended_tool="recall_by_topic",
+                tool_parameters={"topic": "tarkov"},
+                reason="memory question",
+            )
+        ),
+        ask_brain=AsyncMock(return_value=BrainResponse(content="we said a lot", done_reason="stop")),
+    )
+    both_started = asyncio.Event()
+    started: set[str] = set()
+
+    async def mark_started(name: str) -> None:
+        started.add(name)
+        if len(started) == 2:
+            both_started.set()
+        # Neither step can finish until the other one has begun.
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+
+    async def fake_dispatch(*args, **kwargs):
+        await mark_started("tool")
+        return "tarkov recall"
+
+    async def fake_query(*args, **kwargs):
+        await mark_started("rag")
+        return "tarkov rag"
+
+    vector_memory = SimpleNamespace(query=fake_query)
+    tools = SimpleNamespace(KNOWN_TOOLS=frozenset({"recall_by_topic"}), dispatch=fake_dispatch)
+
+    monkeypatch.setattr(bot_module.pipeline, "cache", cache)
+    monkeypatch.setattr(bot_module.pipeline, "memory_worker", memory_worker)
+    monkeypatch.setattr(bot_module.pipeline, "llm", llm)
+    monkeypatch.setattr(bot_module.pipeline, "vector_memory", vector_memory)
+    monkeypatch.setattr(bot_module.pipeline, "tools_module", tools)
+    monkeypatch.setattr(
+        bot_module.pipeline,
+        "prepare_attachments",
+        AsyncMock(return_value=SimpleNamespace(attachments=[])),
+    )
+    monkeypatch.setattr(
+        bot_module.pipeline,
+        "describe_prepared_attachments",
+        AsyncMock(return_value=AttachmentProcessingResult(descriptions=[])),
+    )
+    monkeypatch.setattr(bot_module.pipeline, "send_reply", AsyncMock(return_value=1))
+
+    await bot_module.on_message(message)
+
+    assert llm.ask_brain.await_args.kwargs["rag_context"] == "tarkov rag"
+    assert "tarkov recall" in llm.ask_brain.await_args.kwargs["tool_context"]
+
+
+@pytest.mark.asyncio
+async def test_describe_prepared_attachments_issues_vision_calls_together():
+    in_flight = 0
+    peak = 0
+
+    async def ask_vision_router(image_bytes: bytes) -> str:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return f"caption of {image_bytes.decode()}"
+
+    prepared = AttachmentPreparationResult(
+        attachments=[
+            PreparedAttachment(filename="a.png", image_bytes=b"a"),
+            PreparedAttachment(
+                filename="big.png",
+                fallback_description="[too large]",
+                fallback_reason="oversized",
+            ),
+            PreparedAttachment(filename="b.png", image_bytes=b"b"),
+        ],
+        fallback_count=1,
+        fallback_reasons=["oversized"],
+    )
+
+    result = await describe_prepared_attachments(
+        prepared,
+        SimpleNamespace(ask_vision_router=ask_vision_router, ask_vision=None),
+        detail=False,
+    )
+
+    assert peak == 2
+    assert result.descriptions == ["caption of a", "[too large]", "caption of b"]
+    assert result.fallback_reasons == ["oversized"]
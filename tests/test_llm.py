@@ -1,9 +1,32 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from sandy.config import LlmConfig
 from sandy.llm import (
+    OllamaInterface,
+    BOUNCER_SCHEMA,
+    SMALL_BOUNCER_SCHEMA,
+    SUMMARIZER_SCHEMA,
+    TAGGER_BATCH_SCHEMA,
+    TAGGER_SCHEMA,
     BouncerResponse,
+    SummarizerResponse,
+    TaggerBatchResponse,
+    TaggerResponse,
     _coerce_bouncer_tool_selection,
+    _extract_history_messages,
     _infer_steam_browse_category,
     _looks_like_direct_image_ask,
 )
+from sandy.llm.scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_BRAIN,
+    PRIORITY_INTERACTIVE,
+    PriorityLock,
+)
 
 
 def test_infer_steam_category_prefers_explicit_latest_message():
@@ -17,6 +40,20 @@ def test_infer_steam_category_prefers_explicit_latest_message():
     assert _infer_steam_browse_category(context) == "specials"
 
 
+def test_extract_history_messages_matches_per_line_parsing():
+    context = "\n".join(
+        [
+            "Recent channel history:",
+            "  [2m ago] [alice] first message  ",
+            "[1m ago] [bob] second\r",
+            "not a history line",
+            "[just now] [alice] [bracketed] third",
+        ]
+    )
+
+    assert _extract_history_messages(context) == ["first message", "second", "[bracketed] third"]
+
+
 def test_infer_steam_category_uses_recent_history_for_followup():
     context = "\n".join(
         [
@@ -111,3 +148,574 @@ def test_coerce_bouncer_no_respond_to_true_for_direct_image_ask():
 
     assert coerced.should_respond is True
     assert "attached image or picture" in coerced.reason
+
+
+def test_cached_format_schemas_match_models():
+    assert BOUNCER_SCHEMA == BouncerResponse.model_json_schema()
+    assert "confidence" not in BOUNCER_SCHEMA["properties"]
+    assert "confidence" in SMALL_BOUNCER_SCHEMA["properties"]
+    assert TAGGER_SCHEMA == TaggerResponse.model_json_schema()
+    assert SUMMARIZER_SCHEMA == SummarizerResponse.model_json_schema()
+    assert TAGGER_BATCH_SCHEMA == TaggerBatchResponse.model_json_schema()
+
+
+async def test_structured_calls_send_the_cached_schema_objects():
+    llm = OllamaInterface(LlmConfig())
+    llm._client = SimpleNamespace(chat=AsyncMock(side_effect=[
+        SimpleNamespace(message=SimpleNamespace(content='{"should_respond": false, "reason": "quiet"}')),
+        SimpleNamespace(message=SimpleNamespace(content='{"tags": ["food"]}')),
+        SimpleNamespace(message=SimpleNamespace(content='{"summary": "pizza"}')),
+    ]))
+
+    await llm.ask_bouncer("[just now] [alice] pizza")
+    await llm.ask_tagger("pizza")
+    await llm.ask_summarizer("pizza")
+
+    formats = [call.kwargs["format"] for call in llm._client.chat.await_args_list]
+    assert formats[0] is BOUNCER_SCHEMA
+    assert formats[1] is TAGGER_SCHEMA
+    assert formats[2] is SUMMARIZER_SCHEMA
+
+
+async def test_tagger_and_summarizer_skip_when_lock_stays_busy():
+    llm = OllamaInterface(LlmConfig(background_wait_seconds=0.01))
+    llm._client = SimpleNamespace(chat=AsyncMock())
+
+    async with llm._lock:
+        assert await llm.ask_tagger("hello") == []
+        assert await llm.ask_summarizer("hello") is None
+
+    llm._client.chat.assert_not_awaited()
+    assert not llm.is_busy()
+
+
+async def test_ask_tagger_batch_returns_one_tag_list_per_message():
+    llm = OllamaInterface(LlmConfig())
+    raw = '{"messages": [{"tags": ["Gaming", " "]}, {"tags": ["food", "plan"]}]}'
+    llm._client = SimpleNamespace(
+        chat=AsyncMock(return_value=SimpleNamespace(message=SimpleNamespace(content=raw))),
+    )
+
+    tags = await llm.ask_tagger_batch(["tarkov tonight?", "pizza at 7"])
+
+    assert tags == [["gaming"], ["food", "plan"]]
+    llm._client.chat.assert_awaited_once()
+    assert "Message 2:\npizza at 7" in llm._client.chat.await_args.kwargs["messages"][1]["content"]
+
+
+async def test_ask_tagger_batch_falls_back_to_single_calls_on_count_mismatch():
+    llm = OllamaInterface(LlmConfig())
+    responses = [
+        '{"messages": [{"tags": ["only-one"]}]}',
+        '{"tags": ["first"]}',
+        '{"tags": ["second"]}',
+    ]
+    llm._client = SimpleNamespace(
+        chat=AsyncMock(side_effect=[
+            SimpleNamespace(message=SimpleNamespace(content=raw)) for raw in responses
+        ]),
+    )
+
+    tags = await llm.ask_tagger_batch(["a", "b"])
+
+    assert tags == [["first"], ["second"]]
+
+
+class _FakeBrainStream:
+    """Stands in for the async iterator ollama returns with stream=True."""
+
+    def __init__(self, pieces: list[str]) -> None:
+        self._chunks = [
+            SimpleNamespace(message=SimpleNamespace(content=piece), done=False,
+                            done_reason=None, eval_count=None)
+            for piece in pieces
+        ]
+        self._chunks.append(SimpleNamespace(
+            message=SimpleNamespace(content=""), done=True,
+            done_reason="stop", eval_count=len(pieces),
+        ))
+        self.yielded = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.yielded >= len(self._chunks):
+            raise StopAsyncIteration
+        self.yielded += 1
+        return self._chunks[self.yielded - 1]
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+async def test_ask_brain_pins_static_system_prefix_with_num_keep():
+    llm = OllamaInterface(LlmConfig())
+    llm._client = SimpleNamespace(chat=AsyncMock(return_value=_FakeBrainStream(["hi"])))
+
+    await llm.ask_brain([{"role": "user", "content": "hey sandy"}])
+
+    options = llm._client.chat.await_args.kwargs["options"]
+    system = llm._client.chat.await_args.kwargs["messages"][0]["content"]
+    assert 0 < options["num_keep"] < len(system)
+
+
+def test_brain_prompt_keeps_timestamp_after_stable_channel_text():
+    from sandy.prompt import SandyPrompt
+
+    prompt = SandyPrompt.brain_prompt(server_name="srv", channel_name="chat")
+    stable, _, tail = prompt.user.rpartition("\n\n")
+
+    assert stable.startswith("You are in channel chat in server srv.")
+    assert tail.startswith("The current time is ")
+    assert SandyPrompt.brain_prompt(server_name="srv", channel_name="chat") is prompt
+
+
+def test_prompt_time_is_formatted_once_per_minute(monkeypatch):
+    from datetime import datetime
+    from zoneinfo import ZoneInfo
+
+    from sandy import prompt
+
+    fixed = 1_760_000_000.0
+    monkeypatch.setattr(prompt.time, "time", lambda: fixed)
+    prompt._format_minute.cache_clear()
+
+    first = prompt._now_minute()
+    monkeypatch.setattr(prompt.time, "time", lambda: fixed + 1)
+    assert prompt._now_minute() == first
+    assert prompt._format_minute.cache_info().hits == 1
+    expected = datetime.fromtimestamp(fixed, ZoneInfo("America/Los_Angeles"))
+    assert first == expected.strftime("%Y-%m-%d %H:%M %Z")
+
+
+def test_static_system_prompts_are_read_once():
+    from sandy.prompt import SandyPrompt
+
+    first = SandyPrompt.bouncer_prompt("[just now] [alice] hi")
+    second = SandyPrompt.bouncer_prompt("[just now] [bob] yo")
+
+    assert first.system is second.system
+    assert SandyPrompt.tagger_prompt("a").system is SandyPrompt.tagger_batch_prompt(["a", "b"]).system
+    assert SandyPrompt.vision_router_prompt() is SandyPrompt.vision_router_prompt()
+
+
+async def test_priority_lock_hands_off_to_most_urgent_waiter():
+    lock = PriorityLock()
+    order: list[str] = []
+
+    async def worker(name: str, priority: int) -> None:
+        async with lock.hold(priority):
+            order.append(name)
+
+    await lock.acquire()
+    tasks = [
+        asyncio.create_task(worker("tagger", PRIORITY_BACKGROUND)),
+        asyncio.create_task(worker("bouncer", PRIORITY_INTERACTIVE)),
+        asyncio.create_task(worker("brain", PRIORITY_BRAIN)),
+    ]
+    await asyncio.sleep(0)
+    lock.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["brain", "bouncer", "tagger"]
+    assert lock.locked() is False
+
+
+async def test_priority_lock_skips_cancelled_waiters():
+    lock = PriorityLock()
+    await lock.acquire()
+
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(lock.acquire(PRIORITY_BRAIN), timeout=0.01)
+
+    lock.release()
+    assert lock.locked() is False
+
+
+async def test_tagger_uses_background_keep_alive_unless_model_is_shared():
+    raw = '{"tags": ["food"]}'
+    llm = OllamaInterface(
+        LlmConfig(brain_model="big", bouncer_model="big", tagger_model="small",
+                  keep_alive="1h", background_keep_alive="5m"),
+    )
+    llm._client = SimpleNamespace(
+        chat=AsyncMock(return_value=SimpleNamespace(message=SimpleNamespace(content=raw))),
+    )
+    await llm.ask_tagger("pizza")
+    assert llm._client.chat.await_args.kwargs["keep_alive"] == "5m"
+
+    shared = OllamaInterface(
+        LlmConfig(brain_model="big", bouncer_model="big", tagger_model="big",
+                  keep_alive="1h", background_keep_alive="5m"),
+    )
+    shared._client = llm._client
+    await shared.ask_tagger("pizza")
+    assert llm._client.chat.await_args.kwargs["keep_alive"] == "1h"
+
+
+async def test_heartbeat_pings_primary_models_with_their_num_ctx():
+    llm = OllamaInterface(
+        LlmConfig(brain_model="big", bouncer_model="mid", brain_num_ctx=16384,
+                  bouncer_num_ctx=8192, keep_alive="1h"),
+    )
+    llm._client = SimpleNamespace(generate=AsyncMock(return_value=None))
+
+    assert await llm.heartbeat() == 2
+    calls = [c.kwargs for c in llm._client.generate.await_args_list]
+    assert [(c["model"], c["options"]["num_ctx"]) for c in calls] == [("big", 16384), ("mid", 8192)]
+    assert all(c["keep_alive"] == "1h" for c in calls)
+    assert llm.is_busy() is False
+
+
+async def test_heartbeat_skips_when_llm_stays_busy():
+    llm = OllamaInterface(LlmConfig(background_wait_seconds=0.01))
+    llm._client = SimpleNamespace(generate=AsyncMock(return_value=None))
+    await llm._lock.acquire()
+
+    assert await llm.heartbeat() == 0
+    llm._client.generate.assert_not_awaited()
+    llm._lock.release()
+
+
+async def test_background_wait_zero_queues_instead_of_skipping():
+    raw = '{"summary": "short version"}'
+    llm = OllamaInterface(LlmConfig(background_wait_seconds=0))
+    llm._client = SimpleNamespace(
+        chat=AsyncMock(return_value=SimpleNamespace(message=SimpleNamespace(content=raw))),
+    )
+    await llm._lock.acquire()
+
+    pending = asyncio.create_task(llm.ask_summarizer("a long message " * 20))
+    await asyncio.sleep(0.05)
+    assert not pending.done()
+
+    llm._lock.release()
+    assert await pending == "short version"
+
+
+async def test_ask_brain_collects_streamed_reply():
+    stream = _FakeBrainStream(["hey ", "there", "!"])
+    llm = OllamaInterface(LlmConfig())
+    llm._client = SimpleNamespace(chat=AsyncMock(return_value=stream))
+
+    result = await llm.ask_brain([{"role": "user", "content": "hey sandy"}])
+
+    assert result.content == "hey there!"
+    assert result.done_reason == "stop"
+    assert result.eval_count == 3
+    assert result.first_token_ms is not None
+    assert llm._client.chat.await_args.kwargs["stream"] is True
+    assert stream.closed is True
+
+
+async def test_ask_brain_stop_when_ends_stream_early():
+    stream = _FakeBrainStream(["one. ", "two. ", "three. ", "four."])
+    llm = OllamaInterface(LlmConfig())
+    llm._client = SimpleNamespace(chat=AsyncMock(return_value=stream))
+
+    result = await llm.ask_brain(
+        [{"role": "user", "content": "count"}],
+        stop_when=lambda text: text.count(".") >= 2,
+    )
+
+    assert result.content == "one. two. "
+    assert result.done_reason == "stop_when"
+    assert stream.yielded == 2
+    assert stream.closed is True
+    assert not llm.is_busy()
+
+
+def test_steam_category_keywords_match_whole_words_only():
+    context = "\n".join(
+        [
+            "[just now] [alice] any wholesale bundles on steam?",
+        ]
+    )
+
+    # "sale" inside "wholesale" must not pick the specials category.
+    assert _infer_steam_browse_category(context) == "top_sellers"
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "any discounted games on steam?",
+        "what's on-sale on steam",
+        "steam sales this week?",
+    ],
+)
+def test_steam_category_keywords_still_match_inflected_forms(message):
+    context = f"[just now] [alice] {message}"
+
+    assert _infer_steam_browse_category(context) == "specials"
+
+
+async def test_is_running_probes_ps_and_caches_success():
+    llm = OllamaInterface(LlmConfig())
+    llm._client = SimpleNamespace(ps=AsyncMock(), list=AsyncMock())
+
+    assert await llm.is_running() is True
+    assert await llm.is_running() is True
+
+    llm._client.ps.assert_awaited_once()
+    llm._client.list.assert_not_awaited()
+
+
+async def test_is_running_does_not_cache_failures():
+    llm = OllamaInterface(LlmConfig())
+    llm._client = SimpleNamespace(ps=AsyncMock(side_effect=[ConnectionError("down"), None]))
+
+    assert await llm.is_running() is False
+    assert await llm.is_running() is True
+    assert llm._client.ps.await_count == 2
+
+
+async def test_ask_bouncer_error_returns_no_respond_fallback():
+    llm = OllamaInterface(LlmConfig())
+    llm._client = SimpleNamespace(chat=AsyncMock(side_effect=ConnectionError("down")))
+
+    result = await llm.ask_bouncer("[just now] [alice] hey sandy")
+
+    assert isinstance(result, BouncerResponse)
+    assert result.should_respond is False
+    assert result.use_tool is False
+    assert result.recommended_tool is None
+    assert result.tool_parameters is None
+    assert result.reason == "error: down"
+
+
+async def test_priority_lock_with_two_slots_admits_two_holders():
+    lock = PriorityLock(slots=2)
+    await lock.acquire(PRIORITY_BRAIN)
+    assert lock.locked() is False
+
+    await lock.acquire(PRIORITY_BACKGROUND)
+    assert lock.locked() is True
+    assert lock.in_use == 2
+
+    waiter = asyncio.create_task(lock.acquire(PRIORITY_INTERACTIVE))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    lock.release()
+    await waiter
+    assert lock.in_use == 2
+
+    lock.release()
+    lock.release()
+    assert lock.in_use == 0
+
+
+def test_parallel_slots_config_sizes_the_llm_lock():
+    llm = OllamaInterface(LlmConfig(parallel_slots=2))
+    assert llm._lock.slots == 2
+    assert llm.is_busy() is False
+
+
+async def test_concurrent_ask_tagger_calls_coalesce_into_one_batch():
+    llm = OllamaInterface(LlmConfig(tagger_batch_window_seconds=0.01, tagger_batch_max=8))
+    raw = '{"messages": [{"tags": ["a"]}, {"tags": ["b"]}, {"tags": ["c"]}]}'
+    llm._client = SimpleNamespace(
+        chat=AsyncMock(return_value=SimpleNamespace(message=SimpleNamespace(content=raw))),
+    )
+
+    tags = await asyncio.gather(
+        llm.ask_tagger("first"),
+        llm.ask_tagger("second"),
+        llm.ask_tagger("third"),
+    )
+
+    assert tags == [["a"], ["b"], ["c"]]
+    llm._client.chat.assert_awaited_once()
+    assert llm._client.chat.await_args.kwargs["format"] is TAGGER_BATCH_SCHEMA
+
+
+async def test_ask_tagger_flushes_as_soon_as_batch_is_full():
+    llm = OllamaInterface(LlmConfig(tagger_batch_window_seconds=60, tagger_batch_max=2))
+    raw = '{"messages": [{"tags": ["a"]}, {"tags": ["b"]}]}'
+    llm._client = SimpleNamespace(
+        chat=AsyncMock(return_value=SimpleNamespace(message=SimpleNamespace(content=raw))),
+    )
+
+    tags = await asyncio.wait_for(
+        asyncio.gather(llm.ask_tagger("first"), llm.ask_tagger("second")),
+        timeout=1,
+    )
+
+    assert tags == [["a"], ["b"]]
+
+
+async def test_ask_tagger_splits_batches_that_would_outgrow_the_context():
+    llm = OllamaInterface(LlmConfig(tagger_batch_window_seconds=0.01, tagger_batch_max=8, tagger_num_ctx=1024))
+    budget = llm._tagger_batch_budget
+    batch_sizes: list[int] = []
+
+    async def chat(**kwargs):
+        body = kwargs["messages"][1]["content"]
+        count = body.count("Message ") if kwargs["format"] is TAGGER_BATCH_SCHEMA else 1
+        batch_sizes.append(count)
+        if count == 1:
+            return SimpleNamespace(message=SimpleNamespace(content='{"tags": ["solo"]}'))
+        entries = ", ".join('{"tags": ["a"]}' for _ in range(count))
+        return SimpleNamespace(message=SimpleNamespace(content=f'{{"messages": [{entries}]}}'))
+
+    llm._client = SimpleNamespace(chat=AsyncMock(side_effect=chat))
+    medium = "x" * (budget // 3)
+
+    tags = await asyncio.gather(
+        *(llm.ask_tagger(medium) for _ in range(4)),
+        llm.ask_tagger("y" * (budget + 1)),
+    )
+
+    assert tags[-1] == ["solo"]
+    assert sorted(batch_sizes) == [1, 2, 2]
+    assert all(tag for tag in tags)
+
+
+async def test_drain_tagger_runs_pending_calls_without_waiting_for_the_window():
+    llm = OllamaInterface(LlmConfig(tagger_batch_window_seconds=60, tagger_batch_max=8))
+    llm._client = SimpleNamespace(
+        chat=AsyncMock(return_value=SimpleNamespace(message=SimpleNamespace(content='{"tags": ["a"]}'))),
+    )
+
+    pending = asyncio.create_task(llm.ask_tagger("first"))
+    await asyncio.sleep(0)
+    await asyncio.wait_for(llm.drain_tagger(), timeout=1)
+
+    assert pending.done()
+    assert await pending == ["a"]
+    assert llm._tagger_tasks == set()
+
+
+async def test_cancelled_tagger_batch_still_answers_its_callers():
+    release = asyncio.Event()
+
+    async def chat(**kwargs):
+        await release.wait()
+
+    llm = OllamaInterface(LlmConfig(tagger_batch_window_seconds=60, tagger_batch_max=8))
+    llm._client = SimpleNamespace(chat=AsyncMock(side_effect=chat))
+
+    pending = asyncio.create_task(llm.ask_tagger("first"))
+    await asyncio.sleep(0)
+    llm._flush_tagger_pending()
+    await asyncio.sleep(0)
+    for task in llm._tagger_tasks:
+        task.cancel()
+
+    assert await asyncio.wait_for(pending, timeout=1) == []
+
+
+async def test_ask_tagger_without_batching_makes_a_single_call():
+    llm = OllamaInterface(LlmConfig(tagger_batch_max=1))
+    llm._client = SimpleNamespace(
+        chat=AsyncMock(return_value=SimpleNamespace(message=SimpleNamespace(content='{"tags": ["solo"]}'))),
+    )
+
+    assert await llm.ask_tagger("only") == ["solo"]
+    assert llm._client.chat.await_args.kwargs["format"] is TAGGER_SCHEMA
+
+
+def test_tagger_response_normalises_tags_in_one_pass():
+    result = TaggerResponse(tags=["  Pizza ", "", "   ", "FOOD", "late night", "extra"])
+    assert result.tags == ["pizza", "food", "late night"]
+
+
+@pytest.mark.parametrize(
+    ("latest", "trivial"),
+    [
+        ("lol", True),
+        ("hahaha!!", True),
+        ("kk", True),
+        ("🔥🔥", True),
+        ("lol?", False),
+        ("lol sandy that's wild", False),
+        ("ok sandy", False),
+        ("(no text content)", False),
+    ],
+)
+async def test_bouncer_fast_path_only_skips_trivial_messages(latest, trivial):
+    llm = OllamaInterface(LlmConfig())
+    raw = '{"should_respond": true, "reason": "asked", "use_tool": false}'
+    llm._client = SimpleNamespace(
+        chat=AsyncMock(return_value=SimpleNamespace(message=SimpleNamespace(content=raw))),
+    )
+    context = f"[2m ago] [bob] sandy what do you think?\n[just now] [alice] {latest}"
+
+    result = await llm.ask_bouncer(context)
+
+    assert result.should_respond is not trivial
+    assert llm._client.chat.await_count == (0 if trivial else 1)
+
+
+def _bouncer_reply(payload: str):
+    return SimpleNamespace(message=SimpleNamespace(content=payload))
+
+
+async def test_small_bouncer_answer_kept_when_confident():
+    llm = OllamaInterface(
+        LlmConfig(bouncer_model="big", tagger_model="tiny", bouncer_small_model="tiny",
+                  bouncer_num_ctx=8192, tagger_num_ctx=4096),
+    )
+    llm._client = SimpleNamespace(chat=AsyncMock(return_value=_bouncer_reply(
+        '{"should_respond": true, "reason": "named", "confidence": 0.95}',
+    )))
+
+    result = await llm.ask_bouncer("[just now] [alice] sandy what's up")
+
+    assert result.should_respond is True
+    assert llm._client.chat.await_count == 1
+    call = llm._client.chat.await_args.kwargs
+    assert call["model"] == "tiny"
+    assert call["options"]["num_ctx"] == 4096
+    assert call["format"] is SMALL_BOUNCER_SCHEMA
+    assert "below 0.8 whenever" in call["messages"][0]["content"]
+
+
+async def test_small_bouncer_escalates_when_unsure():
+    llm = OllamaInterface(LlmConfig(bouncer_model="big", bouncer_small_model="tiny"))
+    llm._client = SimpleNamespace(chat=AsyncMock(side_effect=[
+        _bouncer_reply('{"should_respond": false, "reason": "maybe", "confidence": 0.4}'),
+        _bouncer_reply('{"should_respond": true, "reason": "open question"}'),
+    ]))
+
+    result = await llm.ask_bouncer("[just now] [alice] anyone know a good ramen place")
+
+    assert result.should_respond is True
+    small_call, big_call = (c.kwargs for c in llm._client.chat.await_args_list)
+    assert [small_call["model"], big_call["model"]] == ["tiny", "big"]
+    assert big_call["format"] is BOUNCER_SCHEMA
+    assert "confidence" not in big_call["messages"][0]["content"]
+
+
+def test_bouncer_prompt_confidence_threshold_follows_config():
+    from sandy.prompt import SandyPrompt
+
+    default = SandyPrompt.bouncer_prompt("[just now] [alice] hi")
+    small = SandyPrompt.bouncer_prompt("[just now] [alice] hi", confidence_below=0.65)
+
+    assert "confidence" not in default.system
+    assert "below 0.65 whenever" in small.system
+    assert small.system.startswith(default.system)
+
+
+async def test_warm_model_prefills_brain_persona():
+    from sandy.prompt import SandyPrompt
+
+    llm = OllamaInterface(
+        LlmConfig(brain_model="big", bouncer_model="mid", brain_num_ctx=16384, prewarm_num_ctx=16384),
+    )
+    llm._client = SimpleNamespace(
+        chat=AsyncMock(return_value=SimpleNamespace(prompt_eval_count=1300)),
+        generate=AsyncMock(return_value=None),
+    )
+
+    assert await llm.warm_model("big") is True
+    call = llm._client.chat.await_args.kwargs
+    assert call["messages"] == [{"role": "system", "content": SandyPrompt.brain_prompt().system}]
+    assert call["options"]["num_ctx"] == 16384
+
+    assert await llm.warm_model("mid") is True
+    assert llm._client.generate.await_args.kwargs["model"] == "mid"
@@ -2,8 +2,15 @@ from __future__ import annotations
 
 import json
 import logging
+import queue
 
-from sandy.logconf import ConsoleFormatter, JsonlFormatter, _HttpxConsoleFilter, emit_forensic_record
+from sandy.logconf import (
+    ConsoleFormatter,
+    JsonlFormatter,
+    _DeferredFormatQueueHandler,
+    _HttpxConsoleFilter,
+    emit_forensic_record,
+)
 
 
 def test_jsonl_formatter_marks_trace_records() -> None:
@@ -122,3 +129,25 @@ def test_httpx_console_filter_suppresses_info_but_keeps_warnings() -> None:
     assert flt.filter(info_record) is False
     assert flt.filter(warning_record) is True
     assert flt.filter(other_record) is True
+
+
+def test_queue_handler_defers_formatting_to_listener() -> None:
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    handler = _DeferredFormatQueueHandler(log_queue)
+    record = logging.LogRecord(
+        name="sandy.test",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg="hello %s",
+        args=("world",),
+        exc_info=None,
+    )
+
+    handler.handle(record)
+    queued = log_queue.get_nowait()
+
+    assert queued is record
+    assert queued.msg == "hello %s"
+    assert queued.args == ("world",)
+    assert queued.getMessage() == "hello world"
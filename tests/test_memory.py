@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
@@ -9,7 +12,8 @@ import pytest
 
 from sandy.last10 import Last10
 from sandy.memory import MemoryClient
-from sandy.vector_memory import VectorMemory
+from sandy import vector_memory as vector_memory_module
+from sandy.vector_memory import VectorMemory, VectorRecord
 
 
 @dataclass
@@ -226,6 +230,30 @@ async def test_process_and_store_continues_without_summary_if_summarizer_fails()
     )
 
 
+@pytest.mark.asyncio
+async def test_process_and_store_issues_tagger_and_summarizer_concurrently():
+    created_messages = []
+    db = SimpleNamespace(create_message=lambda message: created_messages.append(message))
+    summarizer_started = asyncio.Event()
+
+    async def ask_tagger(content):
+        await asyncio.wait_for(summarizer_started.wait(), timeout=1)
+        return ["tag"]
+
+    async def ask_summarizer(content):
+        summarizer_started.set()
+        return "short summary"
+
+    llm = SimpleNamespace(ask_tagger=ask_tagger, ask_summarizer=ask_summarizer)
+    client = MemoryClient(db=db, llm=llm)
+    client.SUMMARIZE_THRESHOLD = 1
+
+    await client.process_and_store(make_message(content="long enough"))
+
+    assert created_messages[0].tags == ["tag"]
+    assert created_messages[0].summary == "short summary"
+
+
 @pytest.mark.asyncio
 async def test_process_and_store_continues_to_vector_when_recall_store_fails():
     db = SimpleNamespace(create_message=lambda message: (_ for _ in ()).throw(RuntimeError("db down")))
@@ -487,22 +515,41 @@ async def test_drain_deferred_messages_drops_image_only_row_when_attachment_is_g
     client._process_payload.assert_not_awaited()
 
 
-@pytest.mark.asyncio
-async def test_vector_query_passes_server_filter_to_chroma():
-    recorded = {}
+def _bare_vector_memory(**overrides) -> VectorMemory:
+    """A VectorMemory with its state set directly — no ChromaDB or ollama.
+
+    Keyword overrides name attributes without the leading underscore, e.g.
+    ``_bare_vector_memory(doc_count=500, collection=...)``.
+    """
     vector_memory = VectorMemory.__new__(VectorMemory)
+    vector_memory._doc_count = 0
+    vector_memory._pending = []
+    vector_memory._flush_task = None
+    vector_memory._writes = set()
+    vector_memory._inflight = {}
+    vector_memory._results = OrderedDict()
     vector_memory._embed_model = "mxbai-embed-large"
     vector_memory._max_distance = 0.6
-    vector_memory._embed_client = SimpleNamespace(
-        embed=AsyncMock(return_value=SimpleNamespace(embeddings=[[0.1, 0.2, 0.3]]))
-    )
-    vector_memory._collection = SimpleNamespace(
-        count=lambda: 3,
-        query=lambda **kwargs: recorded.update(kwargs) or {
-            "documents": [["private message"]],
-            "metadatas": [[{"author_name": "friend", "timestamp": "2026-03-13T12:00:00+00:00"}]],
-            "distances": [[0.2]],
-        },
+    for name, value in overrides.items():
+        setattr(vector_memory, f"_{name}", value)
+    return vector_memory
+
+
+@pytest.mark.asyncio
+async def test_vector_query_passes_server_filter_to_chroma():
+    recorded = {}
+    vector_memory = _bare_vector_memory(
+        embed_client=SimpleNamespace(
+            embed=AsyncMock(return_value=SimpleNamespace(embeddings=[[0.1, 0.2, 0.3]]))
+        ),
+        collection=SimpleNamespace(
+            count=lambda: 3,
+            query=lambda **kwargs: recorded.update(kwargs) or {
+                "documents": [["private message"]],
+                "metadatas": [[{"author_name": "friend", "timestamp": "2026-03-13T12:00:00+00:00"}]],
+                "distances": [[0.2]],
+            },
+        ),
     )
 
     result = await VectorMemory.query(vector_memory, "secret topic", server_id=4242, n_results=5)
@@ -512,15 +559,261 @@ async def test_vector_query_passes_server_filter_to_chroma():
     assert recorded["n_results"] == 3
 
 
+@pytest.mark.asyncio
+async def test_vector_query_counts_while_embedding():
+    embed_started = threading.Event()
+
+    async def embed(**kwargs):
+        embed_started.set()
+        return SimpleNamespace(embeddings=[[0.1]])
+
+    def count():
+        # Only returns if the embed request was already sent concurrently.
+        assert embed_started.wait(timeout=1)
+        return 1
+
+    vector_memory = _bare_vector_memory(
+        embed_client=SimpleNamespace(embed=embed),
+        collection=SimpleNamespace(
+            count=count,
+            query=lambda **kwargs: {
+                "documents": [["hello"]],
+                "metadatas": [[{"author_name": "friend", "timestamp": ""}]],
+                "distances": [[0.1]],
+            },
+        ),
+    )
+
+    result = await VectorMemory.query(vector_memory, "greeting", server_id=1)
+
+    assert result == "[?] <friend>: hello"
+
+
+@pytest.mark.asyncio
+async def test_vector_query_uses_running_count_for_large_collections():
+    recorded = {}
+
+    def count():
+        raise AssertionError("count() should not run for a large collection")
+
+    vector_memory = _bare_vector_memory(
+        doc_count=500,
+        embed_client=SimpleNamespace(
+            embed=AsyncMock(return_value=SimpleNamespace(embeddings=[[0.1]]))
+        ),
+        collection=SimpleNamespace(
+            count=count,
+            get=lambda **kwargs: {"ids": []},
+            upsert=lambda **kwargs: None,
+            query=lambda **kwargs: recorded.update(kwargs) or {
+                "documents": [[]], "metadatas": [[]], "distances": [[]],
+            },
+        ),
+    )
+
+    await VectorMemory.add_message(
+        vector_memory,
+        message_id="1",
+        content="hello",
+        author_name="friend",
+        server_id=42,
+        timestamp=datetime.now(UTC),
+    )
+    await VectorMemory.query(vector_memory, "hello", server_id=42, n_results=8)
+
+    assert vector_memory._doc_count == 501
+    assert recorded["n_results"] == 8
+
+
+@pytest.mark.asyncio
+async def test_vector_add_message_batches_concurrent_writes():
+    upserts = []
+    vector_memory = _bare_vector_memory(
+        embed_client=SimpleNamespace(
+            embed=AsyncMock(side_effect=lambda model, input: SimpleNamespace(
+                embeddings=[[float(i)] for i, _ in enumerate(input)],
+            ))
+        ),
+        collection=SimpleNamespace(
+            get=lambda **kwargs: {"ids": []},
+            upsert=lambda **kwargs: upserts.append(kwargs),
+        ),
+    )
+
+    results = await asyncio.gather(*(
+        VectorMemory.add_message(
+            vector_memory,
+            message_id=str(i),
+            content=content,
+            author_name="friend",
+            server_id=42,
+            timestamp=datetime(2026, 3, 13, tzinfo=UTC),
+        )
+        for i, content in enumerate(["one", "  ", "three"])
+    ))
+
+    assert results == [True, False, True]
+    vector_memory._embed_client.embed.assert_awaited_once_with(
+        model="mxbai-embed-large", input=["one", "three"],
+    )
+    assert len(upserts) == 1
+    assert upserts[0]["ids"] == ["0", "2"]
+    assert upserts[0]["embeddings"] == [[0.0], [1.0]]
+    assert vector_memory._doc_count == 2
+
+
+@pytest.mark.asyncio
+async def test_vector_cancelled_writer_does_not_strand_its_batch(monkeypatch):
+    monkeypatch.setattr(vector_memory_module, "_BATCH_MAX", 3)
+    release = asyncio.Event()
+
+    async def embed(model, input):
+        await release.wait()
+        return SimpleNamespace(embeddings=[[0.1]] * len(input))
+
+    vector_memory = _bare_vector_memory(
+        embed_client=SimpleNamespace(embed=embed),
+        collection=SimpleNamespace(
+            get=lambda **kwargs: {"ids": []},
+            upsert=lambda **kwargs: None,
+        ),
+    )
+    writers = [
+        asyncio.create_task(VectorMemory.add_message(
+            vector_memory,
+            message_id=str(i),
+            content=f"message {i}",
+            author_name="friend",
+            server_id=42,
+            timestamp=datetime.now(UTC),
+        ))
+        for i in range(3)
+    ]
+    await asyncio.sleep(0)
+    writers[-1].cancel()
+    release.set()
+
+    assert await asyncio.wait_for(asyncio.gather(*writers[:-1]), timeout=1) == [True, True]
+    assert writers[-1].cancelled()
+    assert vector_memory._doc_count == 3
+
+
+@pytest.mark.asyncio
+async def test_vector_add_messages_counts_only_new_ids():
+    vector_memory = _bare_vector_memory(
+        doc_count=1,
+        embed_client=SimpleNamespace(
+            embed=AsyncMock(return_value=SimpleNamespace(embeddings=[[0.1], [0.2]]))
+        ),
+        collection=SimpleNamespace(
+            get=lambda ids, include: {"ids": [i for i in ids if i == "1"]},
+            upsert=lambda **kwargs: None,
+        ),
+    )
+
+    await VectorMemory.add_messages(vector_memory, [
+        VectorRecord("1", "edited", "friend", 42, datetime(2026, 3, 13, tzinfo=UTC)),
+        VectorRecord("2", "new", "friend", 42, datetime(2026, 3, 13, tzinfo=UTC)),
+    ])
+
+    assert vector_memory._doc_count == 2
+
+
+@pytest.mark.asyncio
+async def test_vector_query_stops_at_distance_cutoff():
+    vector_memory = _bare_vector_memory(
+        doc_count=500,
+        embed_client=SimpleNamespace(
+            embed=AsyncMock(return_value=SimpleNamespace(embeddings=[[0.1]]))
+        ),
+        collection=SimpleNamespace(
+            query=lambda **kwargs: {
+                "documents": [["near", "close", "far"]],
+                "metadatas": [[{"author_name": "friend"}] * 3],
+                "distances": [[0.1, 0.5, 0.9]],
+            },
+        ),
+    )
+
+    result = await VectorMemory.query(vector_memory, "hello", server_id=42)
+
+    assert result.splitlines() == ["[?] <friend>: near", "[?] <friend>: close"]
+
+
+@pytest.mark.asyncio
+async def test_vector_aclose_flushes_pending_writes_and_closes_client():
+    upserts = []
+    vector_memory = _bare_vector_memory(
+        embed_client=SimpleNamespace(
+            embed=AsyncMock(return_value=SimpleNamespace(embeddings=[[0.1]])),
+            close=AsyncMock(),
+        ),
+        collection=SimpleNamespace(
+            get=lambda **kwargs: {"ids": []},
+            upsert=lambda **kwargs: upserts.append(kwargs),
+        ),
+    )
+
+    write = asyncio.create_task(VectorMemory.add_message(
+        vector_memory,
+        message_id="1",
+        content="hello",
+        author_name="friend",
+        server_id=42,
+        timestamp=datetime.now(UTC),
+    ))
+    await asyncio.sleep(0)
+    await VectorMemory.aclose(vector_memory)
+
+    assert await write is True
+    assert [u["ids"] for u in upserts] == [["1"]]
+    vector_memory._embed_client.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_vector_query_coalesces_and_caches_identical_queries():
+    release = asyncio.Event()
+
+    async def embed(**kwargs):
+        await release.wait()
+        return SimpleNamespace(embeddings=[[0.1]])
+
+    vector_memory = _bare_vector_memory(
+        doc_count=500,
+        embed_client=SimpleNamespace(embed=AsyncMock(side_effect=embed)),
+        collection=SimpleNamespace(
+            query=lambda **kwargs: {
+                "documents": [["hello"]],
+                "metadatas": [[{"author_name": "friend"}]],
+                "distances": [[0.1]],
+            },
+        ),
+    )
+
+    pending = [
+        asyncio.create_task(VectorMemory.query(vector_memory, "hi", server_id=42))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*pending)
+    again = await VectorMemory.query(vector_memory, "hi", server_id=42)
+    other_server = await VectorMemory.query(vector_memory, "hi", server_id=7)
+
+    assert results == ["[?] <friend>: hello"] * 3
+    assert again == other_server == "[?] <friend>: hello"
+    assert vector_memory._embed_client.embed.await_count == 2
+    assert vector_memory._inflight == {}
+
+
 @pytest.mark.asyncio
 async def test_vector_add_message_raises_on_embed_failure():
-    vector_memory = VectorMemory.__new__(VectorMemory)
-    vector_memory._embed_model = "mxbai-embed-large"
-    vector_memory._max_distance = 0.6
-    vector_memory._embed_client = SimpleNamespace(
-        embed=AsyncMock(side_effect=RuntimeError("embed down"))
+    vector_memory = _bare_vector_memory(
+        embed_client=SimpleNamespace(
+            embed=AsyncMock(side_effect=RuntimeError("embed down"))
+        ),
+        collection=SimpleNamespace(upsert=lambda **kwargs: None),
     )
-    vector_memory._collection = SimpleNamespace(upsert=lambda **kwargs: None)
 
     with pytest.raises(RuntimeError, match="embed down"):
         await VectorMemory.add_message(
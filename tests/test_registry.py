@@ -1,5 +1,8 @@
+import sqlite3
 from pathlib import Path
 
+import pytest
+
 from sandy.registry import Registry
 
 
@@ -14,3 +17,121 @@ def test_registry_voice_admin_round_trip(monkeypatch, tmp_path: Path) -> None:
 
     registry.set_voice_admin(user_id=123, server_id=456, is_admin=False)
     assert registry.is_voice_admin(user_id=123, server_id=456) is False
+
+
+def _message(user_id: int, nick: str | None = None):
+    from types import SimpleNamespace
+
+    return SimpleNamespace(
+        guild=SimpleNamespace(id=456, name="guild"),
+        channel=SimpleNamespace(id=789, name="general"),
+        author=SimpleNamespace(id=user_id, name=f"user{user_id}", nick=nick),
+    )
+
+
+def test_registry_shared_connection_is_safe_across_threads(tmp_path: Path) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    registry = Registry(db_path=str(tmp_path / "server.db"))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(registry.ensure_seen, [_message(uid) for uid in range(40)]))
+
+    assert registry.get_channel_info(789)["server_name"] == "guild"
+    assert registry.get_user_info(39, 456)["user_name"] == "user39"
+    registry.close()
+
+
+def test_ensure_seen_skips_sql_for_known_author_until_nick_changes(tmp_path: Path) -> None:
+    registry = Registry(db_path=str(tmp_path / "server.db"))
+    registry.ensure_seen(_message(1, nick="first"))
+
+    statements: list[str] = []
+    registry._conn.set_trace_callback(statements.append)
+    registry.ensure_seen(_message(1, nick="first"))
+    assert statements == []
+
+    registry.ensure_seen(_message(1, nick="second"))
+    assert statements
+    registry._conn.set_trace_callback(None)
+    assert registry.get_user_info(1, 456)["nickname"] == "second"
+
+
+def test_get_user_infos_matches_single_lookups(tmp_path: Path) -> None:
+    registry = Registry(db_path=str(tmp_path / "server.db"))
+    registry.ensure_seen(_message(1, nick="nick1"))
+    registry.ensure_seen(_message(2))
+
+    infos = registry.get_user_infos([(1, 456), (2, 456), (1, 456), (3, 456), (1, 999)])
+
+    assert infos[(1, 456)]["nickname"] == "nick1"
+    assert infos[(2, 456)]["user_name"] == "user2"
+    assert infos[(2, 456)]["nickname"] is None
+    assert infos[(1, 999)]["nickname"] is None
+    assert (3, 456) not in infos
+    for key in [(1, 456), (2, 456)]:
+        single = registry.get_user_info(*key)
+        assert {k: single[k] for k in ("user_id", "user_name", "nickname")} == {
+            k: infos[key][k] for k in ("user_id", "user_name", "nickname")
+        }
+
+
+def test_registry_creates_per_server_indexes(tmp_path: Path) -> None:
+    registry = Registry(db_path=str(tmp_path / "server.db"))
+
+    with registry._get_conn() as conn:
+        names = {
+            row["name"]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        }
+
+    assert {"idx_channels_server", "idx_nick_server"} <= names
+
+
+def test_lookups_use_read_only_connection_and_see_committed_writes(tmp_path: Path) -> None:
+    registry = Registry(db_path=str(tmp_path / "server.db"))
+
+    with pytest.raises(sqlite3.OperationalError):
+        registry._ro_conn.execute("DELETE FROM users")
+
+    registry.ensure_seen(_message(1, nick="first"))
+    assert registry.get_user_info(1, 456)["nickname"] == "first"
+    registry.ensure_seen(_message(1, nick="second"))
+    assert registry.get_user_info(1, 456)["nickname"] == "second"
+    registry.close()
+
+
+def test_presence_checks_track_new_rows(tmp_path: Path) -> None:
+    registry = Registry(db_path=str(tmp_path / "server.db"))
+    message = _message(1)
+
+    assert not registry.server_seen(message)
+    assert not registry.channel_seen(message)
+    assert not registry.user_seen(message)
+
+    registry.ensure_seen(message)
+
+    assert registry.server_seen(message)
+    assert registry.channel_seen(message)
+    assert registry.user_seen(message)
+    assert not registry.user_seen(_message(2))
+
+
+def test_get_user_infos_caches_until_the_user_changes(tmp_path: Path) -> None:
+    registry = Registry(db_path=str(tmp_path / "server.db"))
+    registry.ensure_seen(_message(1, nick="first"))
+    statements: list[str] = []
+    registry._ro_conn.set_trace_callback(statements.append)
+
+    assert registry.get_user_infos([(1, 456), (2, 456)])[(1, 456)]["nickname"] == "first"
+    queried = len(statements)
+    assert queried
+    assert (2, 456) not in registry.get_user_infos([(1, 456), (2, 456)])
+    assert len(statements) == queried
+
+    registry.ensure_seen(_message(1, nick="second"))
+    registry.ensure_seen(_message(2))
+    infos = registry.get_user_infos([(1, 456), (2, 456)])
+
+    assert infos[(1, 456)]["nickname"] == "second"
+    assert infos[(2, 456)]["user_name"] == "user2"
@@ -28,6 +28,9 @@ def test_default_llm_config_reads_current_environment(monkeypatch) -> None:
     monkeypatch.setenv("VISION_MODEL", "vision-now")
     monkeypatch.setenv("VISION_ROUTER_MODEL", "router-now")
     monkeypatch.setenv("OLLAMA_KEEP_ALIVE", "15m")
+    monkeypatch.setenv("OLLAMA_BACKGROUND_KEEP_ALIVE", "2m")
+    monkeypatch.setenv("LLM_PARALLEL_SLOTS", "2")
+    monkeypatch.setenv("OLLAMA_TIMEOUT_SECONDS", "120")
 
     cfg = _default_llm_config()
 
@@ -38,6 +41,9 @@ def test_default_llm_config_reads_current_environment(monkeypatch) -> None:
     assert cfg.vision_model == "vision-now"
     assert cfg.vision_router_model == "router-now"
     assert cfg.keep_alive == "15m"
+    assert cfg.background_keep_alive == "2m"
+    assert cfg.parallel_slots == 2
+    assert cfg.request_timeout_seconds == 120.0
 
 def test_voice_manager_fallback_uses_runtime_config(monkeypatch) -> None:
     captured: dict[str, object] = {}
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import threading
 from datetime import datetime, UTC
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
@@ -10,10 +12,16 @@ import httpx
 from sandy import tools
 
 
+@pytest.fixture(autouse=True)
+def _fresh_module_state(monkeypatch):
+    monkeypatch.setattr(tools, "_http_client", None)
+    monkeypatch.setattr(tools, "_recall_cache", tools.OrderedDict())
+
+
 @pytest.mark.asyncio
 async def test_dispatch_injects_server_id_and_strips_hallucinated_ids(monkeypatch):
     handler = AsyncMock(return_value="ok")
-    monkeypatch.setitem(tools._HANDLERS, "recall_recent", handler)
+    monkeypatch.setitem(tools._DISPATCH, "recall_recent", (handler, True))
 
     result = await tools.dispatch(
         "recall_recent",
@@ -40,7 +48,7 @@ async def test_dispatch_injects_server_id_and_strips_hallucinated_ids(monkeypatc
 @pytest.mark.asyncio
 async def test_dispatch_preserves_arguments_for_non_server_scoped_tools(monkeypatch):
     handler = AsyncMock(return_value="search results")
-    monkeypatch.setitem(tools._HANDLERS, "search_web", handler)
+    monkeypatch.setitem(tools._DISPATCH, "search_web", (handler, False))
 
     result = await tools.dispatch(
         "search_web",
@@ -70,7 +78,7 @@ async def test_dispatch_unknown_tool_returns_error():
 @pytest.mark.asyncio
 async def test_dispatch_wraps_handler_exception(monkeypatch):
     handler = AsyncMock(side_effect=RuntimeError("boom"))
-    monkeypatch.setitem(tools._HANDLERS, "dice_roll", handler)
+    monkeypatch.setitem(tools._DISPATCH, "dice_roll", (handler, False))
 
     result = await tools.dispatch(
         "dice_roll",
@@ -96,7 +104,7 @@ def test_format_messages_prefers_registry_nickname(monkeypatch):
     monkeypatch.setattr(
         tools,
         "_registry",
-        SimpleNamespace(get_user_info=lambda author_id, server_id: {"nickname": "CurrentNick"}),
+        SimpleNamespace(get_user_infos=lambda pairs: {pair: {"nickname": "CurrentNick"} for pair in pairs}),
     )
 
     formatted = tools._format_messages([row])
@@ -107,6 +115,58 @@ def test_format_messages_prefers_registry_nickname(monkeypatch):
     assert "(summary: said hi)" in formatted
 
 
+@pytest.mark.asyncio
+async def test_lookup_authors_queries_registry_off_the_event_loop(monkeypatch):
+    seen = {}
+
+    def get_user_infos(pairs):
+        seen["thread"] = threading.current_thread()
+        seen["pairs"] = list(pairs)
+        return {(111, 42): {"nickname": "CurrentNick"}}
+
+    monkeypatch.setattr(tools, "_registry", SimpleNamespace(get_user_infos=get_user_infos))
+    rows = [
+        SimpleNamespace(author_id=111, server_id=42),
+        SimpleNamespace(author_id=None, server_id=42),
+    ]
+
+    infos = await tools._lookup_authors(rows)
+
+    assert infos == {(111, 42): {"nickname": "CurrentNick"}}
+    assert seen["pairs"] == [(111, 42)]
+    assert seen["thread"] is not threading.main_thread()
+
+
+def test_format_messages_empty_skips_registry(monkeypatch):
+    monkeypatch.setattr(tools, "_registry", SimpleNamespace())
+
+    assert tools._format_messages([]) == "(no messages found)"
+
+
+@pytest.mark.parametrize(
+    "now",
+    [
+        datetime(2026, 3, 1, 0, 5, tzinfo=tools._PACIFIC),
+        datetime(2026, 7, 12, 12, 30, tzinfo=tools._PACIFIC),
+        datetime(2026, 11, 23, 23, 59, tzinfo=tools._PACIFIC),
+    ],
+)
+def test_describe_time_matches_strftime(now):
+    suffix = {1: "st", 12: "th", 23: "rd"}[now.day]
+
+    assert tools._describe_time(now) == (
+        f"Today is {now.strftime('%A, %B')} {now.day}{suffix}, {now.year}. "
+        f"The current time is {now.strftime('%I:%M %p')} {now.strftime('%Z')}."
+    )
+
+
+def test_format_ts_treats_naive_timestamps_as_utc():
+    aware = datetime(2026, 3, 13, 12, 0, 42, tzinfo=UTC)
+
+    assert tools._format_ts(aware) == "2026-03-13 05:00 PDT"
+    assert tools._format_ts(aware.replace(tzinfo=None)) == "2026-03-13 05:00 PDT"
+
+
 @pytest.mark.asyncio
 async def test_recall_query_translates_argument_names_and_drops_none(monkeypatch):
     calls = []
@@ -137,6 +197,42 @@ async def test_recall_query_translates_argument_names_and_drops_none(monkeypatch
     ]
 
 
+@pytest.mark.asyncio
+async def test_dispatch_many_runs_calls_concurrently_in_order(monkeypatch):
+    both_started = asyncio.Event()
+    started = []
+
+    async def slow(args):
+        started.append(args["n"])
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return f"slow {args['n']} @ {args['server_id']}"
+
+    async def broken(_args):
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(tools._DISPATCH, "recall_recent", (slow, True))
+    monkeypatch.setitem(tools._DISPATCH, "search_memories", (slow, True))
+    monkeypatch.setitem(tools._DISPATCH, "dice_roll", (broken, False))
+
+    results = await tools.dispatch_many(
+        [
+            ("recall_recent", {"n": 1}),
+            ("dice_roll", {}),
+            ("search_memories", {"n": 2, "server_id": 999}),
+        ],
+        server_id=42,
+        server_name="Test Server",
+    )
+
+    assert results == [
+        "slow 1 @ 42",
+        "Error executing dice_roll: boom",
+        "slow 2 @ 42",
+    ]
+
+
 @pytest.mark.asyncio
 async def test_recall_query_returns_none_when_db_not_initialized(monkeypatch):
     monkeypatch.setattr(tools, "_recall_db", None)
@@ -146,16 +242,73 @@ async def test_recall_query_returns_none_when_db_not_initialized(monkeypatch):
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_recall_query_caches_identical_queries(monkeypatch):
+    calls = []
+
+    def get_messages(**kwargs):
+        calls.append(kwargs)
+        return [f"row{len(calls)}"]
+
+    monkeypatch.setattr(tools, "_recall_db", SimpleNamespace(get_messages=get_messages))
+
+    first = await tools._recall_query(server_id=42, author="friend", limit=None)
+    second = await tools._recall_query(author="friend", server_id=42)
+    other = await tools._recall_query(server_id=42, author="someone")
+
+    assert first == second == ["row1"]
+    assert other == ["row2"]
+    assert calls == [
+        {"server_id": 42, "author_name": "friend"},
+        {"server_id": 42, "author_name": "someone"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_recall_query_does_not_cache_errors(monkeypatch):
+    results = [RuntimeError("locked"), ["row"]]
+
+    def get_messages(**kwargs):
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(tools, "_recall_db", SimpleNamespace(get_messages=get_messages))
+
+    assert await tools._recall_query(server_id=42) is None
+    assert await tools._recall_query(server_id=42) == ["row"]
+
+
 @pytest.mark.asyncio
 async def test_recall_recent_formats_success(monkeypatch):
     monkeypatch.setattr(tools, "_recall_query", AsyncMock(return_value=["row1", "row2"]))
-    monkeypatch.setattr(tools, "_format_messages", lambda data: "formatted recall")
+    monkeypatch.setattr(tools, "_registry", None)
+    monkeypatch.setattr(tools, "_format_messages", lambda data, user_infos: "formatted recall")
 
     result = await tools._handle_recall_recent({"hours_ago": 24})
 
     assert result == "2 message(s) retrieved:\n\nformatted recall"
 
 
+@pytest.mark.asyncio
+async def test_large_recall_results_format_in_a_worker_thread(monkeypatch):
+    threads = []
+
+    def fake_format(data, user_infos):
+        threads.append(threading.current_thread())
+        return "formatted"
+
+    monkeypatch.setattr(tools, "_registry", None)
+    monkeypatch.setattr(tools, "_format_messages", fake_format)
+
+    await tools._render_recall(["row"] * 2)
+    await tools._render_recall(["row"] * (tools._THREAD_FORMAT_MIN_ROWS + 1))
+
+    assert threads[0] is threading.main_thread()
+    assert threads[1] is not threading.main_thread()
+
+
 @pytest.mark.asyncio
 async def test_recall_from_user_formats_empty_and_error_cases(monkeypatch):
     monkeypatch.setattr(tools, "_recall_query", AsyncMock(return_value=[]))
@@ -198,6 +351,40 @@ class FakeAsyncClient:
         return self._response
 
 
+@pytest.mark.asyncio
+async def test_search_web_reuses_one_http_client(monkeypatch):
+    fake_client = FakeAsyncClient(FakeSearchResponse({"results": []}))
+    built = []
+
+    def build(**kwargs):
+        built.append(kwargs)
+        return fake_client
+
+    monkeypatch.setattr(tools.httpx, "AsyncClient", build)
+
+    await tools._handle_search_web({"query": "one"})
+    await tools._handle_search_web({"query": "two"})
+
+    assert len(built) == 1
+    assert built[0]["headers"] == {"Accept": "application/json"}
+    assert [call["params"]["q"] for call in fake_client.calls] == ["one", "two"]
+
+
+def test_http_client_is_rebuilt_for_a_new_event_loop(monkeypatch):
+    built = []
+    monkeypatch.setattr(tools.httpx, "AsyncClient", lambda **kwargs: built.append(kwargs) or object())
+
+    async def grab():
+        return tools._get_http_client(), tools._get_http_client()
+
+    first, again = asyncio.run(grab())
+    second, _ = asyncio.run(grab())
+
+    assert first is again
+    assert first is not second
+    assert len(built) == 2
+
+
 @pytest.mark.asyncio
 async def test_search_web_handles_empty_query():
     result = await tools._handle_search_web({"query": "   "})
@@ -229,7 +416,7 @@ async def test_search_web_formats_results_and_truncates_snippets(monkeypatch):
     monkeypatch.setattr(
         tools.httpx,
         "AsyncClient",
-        lambda timeout: fake_client,
+        lambda **kwargs: fake_client,
     )
 
     result = await tools._handle_search_web({"query": "sandy", "n_results": 1})
@@ -251,7 +438,7 @@ async def test_search_web_returns_error_on_http_failure(monkeypatch):
             response=httpx.Response(502),
         ))
     )
-    monkeypatch.setattr(tools.httpx, "AsyncClient", lambda timeout: fake_client)
+    monkeypatch.setattr(tools.httpx, "AsyncClient", lambda **kwargs: fake_client)
 
     result = await tools._handle_search_web({"query": "sandy"})
 
@@ -282,7 +469,7 @@ async def test_steam_browse_formats_specials(monkeypatch):
             }
         )
     )
-    monkeypatch.setattr(tools.httpx, "AsyncClient", lambda timeout: fake_client)
+    monkeypatch.setattr(tools.httpx, "AsyncClient", lambda **kwargs: fake_client)
     monkeypatch.setattr(tools, "_steam_featured_cache", None)
     monkeypatch.setattr(tools, "_steam_featured_cache_expires_at", 0.0)
 
@@ -318,7 +505,7 @@ async def test_steam_browse_supports_upcoming_alias(monkeypatch):
             }
         )
     )
-    monkeypatch.setattr(tools.httpx, "AsyncClient", lambda timeout: fake_client)
+    monkeypatch.setattr(tools.httpx, "AsyncClient", lambda **kwargs: fake_client)
     monkeypatch.setattr(tools, "_steam_featured_cache", None)
     monkeypatch.setattr(tools, "_steam_featured_cache_expires_at", 0.0)
 
@@ -352,7 +539,7 @@ async def test_steam_browse_reuses_cache(monkeypatch):
             }
         )
     )
-    monkeypatch.setattr(tools.httpx, "AsyncClient", lambda timeout: fake_client)
+    monkeypatch.setattr(tools.httpx, "AsyncClient", lambda **kwargs: fake_client)
     monkeypatch.setattr(tools, "_steam_featured_cache", None)
     monkeypatch.setattr(tools, "_steam_featured_cache_expires_at", 0.0)
 
@@ -367,7 +554,7 @@ async def test_steam_browse_reuses_cache(monkeypatch):
 @pytest.mark.asyncio
 async def test_search_web_returns_no_results_message(monkeypatch):
     fake_client = FakeAsyncClient(FakeSearchResponse({"results": []}))
-    monkeypatch.setattr(tools.httpx, "AsyncClient", lambda timeout: fake_client)
+    monkeypatch.setattr(tools.httpx, "AsyncClient", lambda **kwargs: fake_client)
 
     result = await tools._handle_search_web({"query": "sandy"})
 
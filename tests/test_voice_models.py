@@ -7,6 +7,7 @@ from sandy.voice.models import (
     _sanitize_voice_reply,
     _truncate_sentences,
     _truncate_words,
+    _voice_reply_is_complete,
 )
 
 
@@ -113,3 +114,25 @@ class TestSanitizeVoiceReply:
         assert result  # not empty
         assert result[-1] in ".!?"
         assert len(result) <= 225
+
+
+# ── _voice_reply_is_complete ─────────────────────────────────────────────────
+
+class TestVoiceReplyIsComplete:
+    def test_short_reply_is_not_complete(self):
+        assert _voice_reply_is_complete("First. Second.") is False
+
+    def test_started_third_sentence_is_complete(self):
+        assert _voice_reply_is_complete("First. Second. Th") is True
+
+    def test_word_past_cap_is_complete(self):
+        assert _voice_reply_is_complete(" ".join(f"word{i}" for i in range(33))) is True
+
+    def test_stopping_early_does_not_change_sanitized_reply(self):
+        full = "First bit. Second bit here. Third bit that gets dropped anyway."
+        prefix = ""
+        for char in full:
+            prefix += char
+            if _voice_reply_is_complete(prefix):
+                break
+        assert _sanitize_voice_reply(prefix) == _sanitize_voice_reply(full)
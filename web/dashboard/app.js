@@ -195,7 +195,9 @@ function renderStatus(status) {
   const memory = status.memory_worker || {};
   el("memory-state").textContent = memory.busy ? "Running" : (memory.queue_depth > 0 ? "Queued" : "Idle");
   el("memory-note").textContent = memory.busy
-    ? `Processing ${memory.processing_message_id || "message"}`
+    ? (memory.processing_count > 1
+      ? `Processing ${memory.processing_count} messages`
+      : `Processing ${memory.processing_message_id || "message"}`)
     : `Queue depth ${memory.queue_depth ?? 0}`;
 
   const bouncer = status.last_bouncer_decision;